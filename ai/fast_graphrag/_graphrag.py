@@ -1,5 +1,6 @@
 """This module implements a Graph-based Retrieval-Augmented Generation (GraphRAG) system."""
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Dict, Generic, List, Optional, Tuple, Union
 
@@ -224,6 +225,49 @@ class BaseGraphRAG(Generic[GTEmbedding, GTHash, GTChunk, GTNode, GTEdge, GTId]):
 
         return TQueryResponse[GTNode, GTEdge, GTHash, GTChunk](response=answer, context=context)
 
+    async def async_query_many(
+        self,
+        queries: List[str],
+        params: Optional[QueryParam] = None,
+        response_model = None,
+        max_concurrency: int = 50,
+    ) -> List[TQueryResponse[GTNode, GTEdge, GTHash, GTChunk]]:
+        """Run several queries concurrently against the graph.
+
+        The LLM service rate limiter still paces the requests; the semaphore only bounds how many
+        queries are in flight at once, so the network latency of independent queries overlaps.
+
+        Args:
+            queries (list[str]): The query strings to search for in the graph.
+            params (QueryParam, optional): Additional parameters shared by all queries. Defaults to None.
+            max_concurrency (int, optional): Maximum number of queries in flight. Defaults to 50.
+
+        Returns:
+            list[TQueryResponse]: The results, in the same order as ``queries``.
+
+        Raises:
+            Exception: The first error raised by a query, after the remaining queries were cancelled.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(query: str) -> TQueryResponse[GTNode, GTEdge, GTHash, GTChunk]:
+            async with semaphore:
+                return await self.async_query(query, params, response_model)
+
+        await self.state_manager.query_start()
+        try:
+            tasks = [asyncio.ensure_future(_bounded(query)) for query in queries]
+            try:
+                return await asyncio.gather(*tasks)
+            except BaseException:
+                # The storages are closed by query_done(), so no query may still be running against them
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        finally:
+            await self.state_manager.query_done()
+
     def save_graphml(self, output_path: str) -> None:
         """Save the graph in GraphML format."""
         async def _save_graphml() -> None:
@@ -9,7 +9,9 @@ and rate limiting via semaphores and AsyncLimiter.
 """
 
 import asyncio
+import hashlib
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from itertools import chain
 from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Type, cast
@@ -344,13 +346,18 @@ class GeminiEmbeddingService(BaseEmbeddingService):
     default=80
   )  # Google cloud enforces strict limits on batch requests to Gemini embedding endpoints
   max_requests_per_second: int = field(default=20)
+  cache_size: int = field(default=4096)  # Number of embeddings kept in the in-process LRU cache (0 disables it)
 
   def __post_init__(self):
     """Post-initialization.
 
     • Sets up concurrency semaphores and rate limiters for embedding requests.
     • Instantiates the asynchronous client for embedding requests.
+    • Creates the LRU cache used to skip re-embedding repeated texts (e.g. the same query).
     """
+    self._embedding_cache: OrderedDict[bytes, np.ndarray[Any, np.dtype[np.float32]]] = OrderedDict()
+    self._cache_hits = 0
+    self._cache_misses = 0
     self.embedding_max_requests_concurrent = (
       asyncio.Semaphore(self.max_requests_concurrent) if self.rate_limit_concurrency else NoopAsyncContextManager()
     )
@@ -385,17 +392,32 @@ class GeminiEmbeddingService(BaseEmbeddingService):
       if model is None:
         raise ValueError("Model name must be provided.")
 
-      # Batch the texts to not exceed the maximum allowed elements per request.
-      batched_texts = [
-        texts[i * self.max_elements_per_request : (i + 1) * self.max_elements_per_request]
-        for i in range((len(texts) + self.max_elements_per_request - 1) // self.max_elements_per_request)
-      ]
-      # Execute embedding requests concurrently for all batches.
-      response = await asyncio.gather(*[self._embedding_request(batch, model) for batch in batched_texts])
-
-      # Flatten the list of responses and create the embedding numpy array.
-      data = chain(*list(response))
-      embeddings = np.array([dp.values for dp in data])
+      # Serve repeated texts from the cache and only request the missing ones.
+      keys = [self._cache_key(text, model) for text in texts]
+      cached = [self._cache_get(key) for key in keys]
+      missing = [i for i, vector in enumerate(cached) if vector is None]
+      self._cache_hits += len(texts) - len(missing)
+      self._cache_misses += len(missing)
+      logger.debug(f"Embedding cache: {self._cache_hits} hits, {self._cache_misses} misses")
+
+      if missing:
+        missing_texts = [texts[i] for i in missing]
+        # Batch the texts to not exceed the maximum allowed elements per request.
+        batched_texts = [
+          missing_texts[i * self.max_elements_per_request : (i + 1) * self.max_elements_per_request]
+          for i in range((len(missing_texts) + self.max_elements_per_request - 1) // self.max_elements_per_request)
+        ]
+        # Execute embedding requests concurrently for all batches.
+        response = await asyncio.gather(*[self._embedding_request(batch, model) for batch in batched_texts])
+
+        # Flatten the list of responses and store the new vectors in the cache.
+        data = chain(*list(response))
+        for i, dp in zip(missing, data):
+          vector = np.asarray(dp.values, dtype=np.float32)
+          cached[i] = vector
+          self._cache_put(keys[i], vector)
+
+      embeddings = np.array(cached)
       logger.debug(f"Received embedding response: {len(embeddings)} embeddings")
 
       return embeddings
@@ -403,6 +425,25 @@ class GeminiEmbeddingService(BaseEmbeddingService):
       logger.exception("An error occurred during embedding encoding:", exc_info=True)
       raise
 
+  @staticmethod
+  def _cache_key(text: str, model: str) -> bytes:
+    # A fixed-size digest keeps the cache memory bounded regardless of the text length.
+    return hashlib.blake2b(f"{model}\0{text}".encode(), digest_size=16).digest()
+
+  def _cache_get(self, key: bytes) -> Optional[np.ndarray[Any, np.dtype[np.float32]]]:
+    vector = self._embedding_cache.get(key)
+    if vector is not None:
+      self._embedding_cache.move_to_end(key)
+    return vector
+
+  def _cache_put(self, key: bytes, vector: np.ndarray[Any, np.dtype[np.float32]]) -> None:
+    if self.cache_size <= 0:
+      return
+    self._embedding_cache[key] = vector
+    self._embedding_cache.move_to_end(key)
+    while len(self._embedding_cache) > self.cache_size:
+      self._embedding_cache.popitem(last=False)
+
   @retry(
     stop=stop_after_attempt(8),
     wait=wait_exponential(multiplier=1, min=5, max=60),
@@ -91,8 +91,8 @@ class DefaultStateManagerService(BaseStateManagerService[TEntity, TRelation, THa
             if graph is None:
                 return None
 
-            nodes = [t for i in range(await graph.node_count()) if (t := await graph.get_node_by_index(i)) is not None]
-            edges = [t for i in range(await graph.edge_count()) if (t := await graph.get_edge_by_index(i)) is not None]
+            nodes = [t for t in await graph.get_nodes_by_index(range(await graph.node_count())) if t is not None]
+            edges = [t for t in await graph.get_edges_by_index(range(await graph.edge_count())) if t is not None]
 
             return (nodes, edges)
 
@@ -234,8 +234,8 @@ class DefaultStateManagerService(BaseStateManagerService[TEntity, TRelation, THa
             indices, scores = extract_sorted_scores(graph_entity_scores)
             print(f"get_context:Indices and scores:", indices, scores)
             relevant_entities: List[Tuple[TEntity, TScore]] = []
-            for i, s in zip(indices, scores):
-                entity = await self.graph_storage.get_node_by_index(i)
+            entities = await self.graph_storage.get_nodes_by_index(indices)
+            for i, entity, s in zip(indices, entities, scores):
                 print(f"get_context:Entity at index {i} with score {s}:", entity)
                 if entity is not None:
                     relevant_entities.append((entity, s))
@@ -247,8 +247,7 @@ class DefaultStateManagerService(BaseStateManagerService[TEntity, TRelation, THa
             print(f"get_context:Relation scores:", relation_scores)
             indices, scores = extract_sorted_scores(relation_scores)
             relevant_relationships: List[Tuple[TRelation, TScore]] = []
-            for i, s in zip(indices, scores):
-                relationship = await self.graph_storage.get_edge_by_index(i)
+            for relationship, s in zip(await self.graph_storage.get_edges_by_index(indices), scores):
                 if relationship is not None:
                     relevant_relationships.append((relationship, s))
 
@@ -230,6 +230,12 @@ class BaseGraphStorage(BaseStorage, Generic[GTNode, GTEdge, GTId]):
     async def get_edge_by_index(self, index: TIndex) -> Union[GTEdge, None]:
         raise NotImplementedError
 
+    async def get_nodes_by_index(self, indices: Iterable[TIndex]) -> List[Union[GTNode, None]]:
+        return [await self.get_node_by_index(index) for index in indices]
+
+    async def get_edges_by_index(self, indices: Iterable[TIndex]) -> List[Union[GTEdge, None]]:
+        return [await self.get_edge_by_index(index) for index in indices]
+
     async def upsert_node(self, node: GTNode, node_index: Union[TIndex, None]) -> TIndex:
         raise NotImplementedError
 
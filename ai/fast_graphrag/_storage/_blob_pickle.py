@@ -1,10 +1,9 @@
-import pickle
 from dataclasses import dataclass, field
 from typing import Optional
 
 from fast_graphrag._exceptions import InvalidStorageError
 from fast_graphrag._types import GTBlob
-from fast_graphrag._utils import logger
+from fast_graphrag._utils import dump_pickle, load_pickle, logger
 
 from ._base import BaseBlobStorage
 
@@ -27,8 +26,7 @@ class PickleBlobStorage(BaseBlobStorage[GTBlob]):
             data_file_name = self.namespace.get_load_path(self.RESOURCE_NAME)
             if data_file_name:
                 try:
-                    with open(data_file_name, "rb") as f:
-                        self._data = pickle.load(f)
+                    self._data = await load_pickle(data_file_name)
                 except Exception as e:
                     t = f"Error loading data file for blob storage {data_file_name}: {e}"
                     logger.error(t)
@@ -45,8 +43,7 @@ class PickleBlobStorage(BaseBlobStorage[GTBlob]):
             data_file_name = self.namespace.get_save_path(self.RESOURCE_NAME)
             try:
                 print(f"PickleBlobStorage:_insert_done:Saving blob storage to file {data_file_name}.", self._data)
-                with open(data_file_name, "wb") as f:
-                    pickle.dump(self._data, f)
+                await dump_pickle(self._data, data_file_name)
                 logger.debug(
                     f"Saving blob storage '{data_file_name}'."
                 )
@@ -60,9 +57,8 @@ class PickleBlobStorage(BaseBlobStorage[GTBlob]):
         print(f"PickleBlobStorage:_query_start:Loading blob storage for namespace:", self.namespace)
         if data_file_name:
             try:
-                with open(data_file_name, "rb") as f:
-                    self._data = pickle.load(f)
-                    print(f"PickleBlobStorage:_query_start:Loaded blob storage from file {data_file_name}.", self._data)
+                self._data = await load_pickle(data_file_name)
+                print(f"PickleBlobStorage:_query_start:Loaded blob storage from file {data_file_name}.", self._data)
             except Exception as e:
                 t = f"Error loading data file for blob storage {data_file_name}: {e}"
                 logger.error(t)
@@ -9,6 +9,8 @@ __all__ = [
     "Neo4jGraphStorageConfig",
 ]
 
+from dataclasses import dataclass, field
+
 from fast_graphrag._storage._blob_pickle import PickleBlobStorage
 from fast_graphrag._storage._gdb_igraph import IGraphStorage, IGraphStorageConfig
 from fast_graphrag._storage._gdb_neo4j import Neo4jStorage, Neo4jStorageConfig
@@ -20,8 +22,12 @@ from fast_graphrag._types import GTBlob, GTEdge, GTEmbedding, GTId, GTKey, GTNod
 # Storage
 class DefaultVectorStorage(HNSWVectorStorage[GTId, GTEmbedding]):
     pass
+@dataclass
 class DefaultVectorStorageConfig(HNSWVectorStorageConfig):
-    pass
+    # Recall flattens out quickly past ef_construction ~128 while build time keeps growing;
+    # ef_construction close to M (and to ef_search) is usually the sweet spot.
+    ef_construction: int = field(default=64)
+    M: int = field(default=16)
 class DefaultBlobStorage(PickleBlobStorage[GTBlob]):
     pass
 class DefaultIndexedKeyValueStorage(PickleIndexedKeyValueStorage[GTKey, GTValue]):
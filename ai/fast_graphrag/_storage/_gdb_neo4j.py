@@ -3,22 +3,448 @@ Neo4j Graph Storage Implementation for Fast GraphRAG
 Provides scalable graph storage using Neo4j for production environments.
 """
 
+import asyncio
+import atexit
 import json
 import os
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, Generic, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, Union, cast, LiteralString
+import weakref
+from collections import OrderedDict
+from itertools import islice
+from operator import attrgetter
+from dataclasses import dataclass, field, fields
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
-from neo4j import GraphDatabase, basic_auth, Driver
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+    Record,
+    RoutingControl,
+    basic_auth,
+)
+from neo4j.exceptions import ClientError
 from scipy.sparse import csr_matrix
 
 from fast_graphrag._exceptions import InvalidStorageError
-from fast_graphrag._types import GTEdge, GTId, GTNode, TIndex
-from fast_graphrag._utils import csr_from_indices_list, logger
+from fast_graphrag._types import GTEdge, GTId, GTNode, TIndex, TScore
+from fast_graphrag._utils import logger
 
 from ._base import BaseGraphStorage
 
 
+# The GDS projection covers the whole database, so it is shared by every storage connected to it. Its name
+# carries the database-wide graph version below, so a projection is never reused after any storage changed the graph
+_GDS_GRAPH_NAME_PREFIX = "graphrag_graph"
+
+# Database-wide graph version, bumped by a storage after it changed the graph
+_CYPHER_GRAPH_VERSION = """
+OPTIONAL MATCH (m:GraphRAGMeta {key: 'graph'})
+RETURN coalesce(m.version, 0) AS version
+"""
+
+_CYPHER_BUMP_GRAPH_VERSION = """
+MERGE (m:GraphRAGMeta {key: 'graph'})
+SET m.version = coalesce(m.version, 0) + 1
+RETURN m.version AS version
+"""
+
+# Drops the projections of older graph versions (and the unversioned one used before), without failing
+# when one was dropped concurrently
+_CYPHER_DROP_STALE_GDS_GRAPHS = """
+CALL gds.graph.list() YIELD graphName
+WITH graphName WHERE graphName STARTS WITH $prefix AND graphName <> $graph_name
+CALL gds.graph.drop(graphName, false) YIELD graphName AS dropped
+RETURN count(dropped) AS dropped
+"""
+
+# The current maximum sequence ID is read from the end of the sequence_id range index (ORDER BY ... DESC
+# LIMIT 1) instead of aggregating max() over every node or relationship on each write
+_CYPHER_NODE_SEQUENCE_ID = """
+WITH coalesce(head(COLLECT {
+    MATCH (existing:Entity) WHERE existing.sequence_id IS NOT NULL
+    RETURN existing.sequence_id ORDER BY existing.sequence_id DESC LIMIT 1
+}), -1) + 1 AS next_id
+MERGE (n:Entity {name: $node_name})
+ON CREATE SET n.sequence_id = next_id
+ON MATCH SET n.sequence_id = coalesce(n.sequence_id, next_id)
+RETURN n.sequence_id as sequence_id
+"""
+
+_CYPHER_EDGE_SEQUENCE_ID = """
+MATCH (s:Entity {name: $source_name}), (t:Entity {name: $target_name})
+WITH s, t, coalesce(head(COLLECT {
+    MATCH ()-[existing_rel:RELATED]->() WHERE existing_rel.sequence_id IS NOT NULL
+    RETURN existing_rel.sequence_id ORDER BY existing_rel.sequence_id DESC LIMIT 1
+}), -1) + 1 AS next_id
+MERGE (s)-[r:RELATED]->(t)
+ON CREATE SET r.sequence_id = next_id
+ON MATCH SET r.sequence_id = coalesce(r.sequence_id, next_id)
+RETURN r.sequence_id as sequence_id
+"""
+
+_CYPHER_NODE_NAME_BY_SEQUENCE_ID = """
+MATCH (n:Entity {sequence_id: $sequence_id})
+RETURN n.name as name
+"""
+
+# Single-edge lookups seek the relationship sequence_id index and read the endpoints off the relationship,
+# labelled endpoint patterns would make the planner expand from the nodes instead
+_CYPHER_EDGE_NAMES_BY_SEQUENCE_ID = """
+MATCH ()-[r:RELATED {sequence_id: $sequence_id}]->()
+RETURN startNode(r).name as source_name, endNode(r).name as target_name
+"""
+
+# Streamed back to the client instead of written to the server's filesystem, where a client-side path
+# would point to the wrong host. With batchSize the document arrives in several consecutive parts
+_CYPHER_EXPORT_GRAPHML = """
+CALL apoc.export.graphml.all(null, {stream: true, batchSize: 10000})
+YIELD data
+RETURN data
+"""
+
+# Both counts are answered from Neo4j's count store without touching the nodes or relationships
+_CYPHER_NODE_COUNT = "MATCH (n:Entity) RETURN count(n) as count"
+
+_CYPHER_EDGE_COUNT = "MATCH ()-[r:RELATED]->() RETURN count(r) as count"
+
+# Entities are returned as properties() maps, which the driver decodes straight into a dict,
+# instead of Node/Relationship objects that have to be copied into a dict again.
+# UNWIND keeps the order of $ids, missing names come back with null properties
+_CYPHER_GET_NODES = """
+UNWIND $ids AS id
+OPTIONAL MATCH (n:Entity {name: id})
+RETURN id, properties(n) AS properties, n.sequence_id AS sequence_id
+"""
+
+# Inline property maps anchor both endpoints on the entity_name constraint before expanding
+_CYPHER_GET_EDGES = """
+MATCH (s:Entity {name: $source})-[r:RELATED]->(t:Entity {name: $target})
+RETURN properties(r) AS properties, r.sequence_id AS sequence_id, s.name AS source_name, t.name AS target_name
+"""
+
+# UNWIND keeps the order of $sequence_ids, missing IDs come back with null properties
+_CYPHER_GET_NODES_BY_INDEX = """
+UNWIND $sequence_ids AS sequence_id
+OPTIONAL MATCH (n:Entity {sequence_id: sequence_id})
+RETURN sequence_id, properties(n) AS properties
+"""
+
+_CYPHER_GET_EDGES_BY_INDEX = """
+UNWIND $sequence_ids AS sequence_id
+OPTIONAL MATCH ()-[r:RELATED {sequence_id: sequence_id}]->()
+RETURN sequence_id, properties(r) AS properties, startNode(r).name AS source_name, endNode(r).name AS target_name
+"""
+
+# Existing nodes keep their sequence ID, new ones are numbered densely after the current maximum
+_CYPHER_LOOKUP_NODES = """
+WITH coalesce(head(COLLECT {
+    MATCH (existing:Entity) WHERE existing.sequence_id IS NOT NULL
+    RETURN existing.sequence_id ORDER BY existing.sequence_id DESC LIMIT 1
+}), -1) AS max_seq_id
+UNWIND $names AS name
+OPTIONAL MATCH (n:Entity {name: name})
+RETURN max_seq_id, name, n.sequence_id AS sequence_id
+"""
+
+_CYPHER_UPSERT_NODES = """
+UNWIND $rows AS row
+MERGE (n:Entity {name: row.name})
+ON CREATE SET n.sequence_id = row.sequence_id
+ON MATCH SET n.sequence_id = coalesce(n.sequence_id, row.sequence_id)
+SET n += row.properties
+"""
+
+# A new edge is always created, like the other graph storages do for upsert_edge(edge, None); MERGE would
+# first look for an existing relationship between the endpoints and silently update it instead
+_CYPHER_CREATE_EDGE = """
+MATCH (s:Entity {name: $source}), (t:Entity {name: $target})
+WITH s, t, coalesce(head(COLLECT {
+    MATCH ()-[existing_rel:RELATED]->() WHERE existing_rel.sequence_id IS NOT NULL
+    RETURN existing_rel.sequence_id ORDER BY existing_rel.sequence_id DESC LIMIT 1
+}), -1) + 1 AS next_id
+CREATE (s)-[r:RELATED]->(t)
+SET r += $properties,
+    r.sequence_id = next_id
+RETURN r.sequence_id as sequence_id
+"""
+
+_CYPHER_UPDATE_EDGES = """
+UNWIND $rows AS row
+MATCH ()-[r:RELATED {sequence_id: row.sequence_id}]->()
+SET r += row.properties
+"""
+
+# Batch create edges with sequence IDs. Rows are committed in sub-batches so a large insert does not
+# build one huge transaction; CALL {} IN TRANSACTIONS only runs in auto-commit transactions (session.run)
+_CYPHER_INSERT_EDGES = """
+WITH coalesce(head(COLLECT {
+    MATCH ()-[existing_rel:RELATED]->() WHERE existing_rel.sequence_id IS NOT NULL
+    RETURN existing_rel.sequence_id ORDER BY existing_rel.sequence_id DESC LIMIT 1
+}), -1) AS max_seq_id
+UNWIND range(0, size($edges) - 1) AS idx
+CALL {
+    WITH max_seq_id, idx
+    WITH max_seq_id, idx, $edges[idx] AS edge_data
+    MATCH (s:Entity {name: edge_data.source})
+    MATCH (t:Entity {name: edge_data.target})
+    CREATE (s)-[r:RELATED]->(t)
+    SET r += edge_data.properties,
+        r.sequence_id = max_seq_id + idx + 1
+    RETURN r.sequence_id AS sequence_id
+} IN TRANSACTIONS OF 5000 ROWS
+RETURN sequence_id
+"""
+
+# Endpoints are resolved by node sequence ID (Entity.sequence_id index) in the same statement, and each row
+# carries the properties of its own edge.
+# Pairs with a missing endpoint are dropped before numbering, so the new edge sequence IDs stay dense
+_CYPHER_INSERT_EDGES_BY_INDEX_WITH_ATTRS = """
+WITH coalesce(head(COLLECT {
+    MATCH ()-[existing_rel:RELATED]->() WHERE existing_rel.sequence_id IS NOT NULL
+    RETURN existing_rel.sequence_id ORDER BY existing_rel.sequence_id DESC LIMIT 1
+}), -1) AS max_seq_id
+UNWIND $rows AS row
+MATCH (s:Entity {sequence_id: row.pair[0]})
+MATCH (t:Entity {sequence_id: row.pair[1]})
+WITH max_seq_id, collect({s: s, t: t, properties: row.properties}) AS edges
+UNWIND range(0, size(edges) - 1) AS idx
+CALL {
+    WITH max_seq_id, idx, edges
+    WITH max_seq_id, idx, edges[idx].s AS s, edges[idx].t AS t, edges[idx].properties AS properties
+    CREATE (s)-[r:RELATED]->(t)
+    SET r += properties,
+        r.sequence_id = max_seq_id + idx + 1
+    RETURN r.sequence_id AS sequence_id
+} IN TRANSACTIONS OF 5000 ROWS
+RETURN sequence_id
+"""
+
+_CYPHER_INSERT_EDGES_BY_INDEX = """
+WITH coalesce(head(COLLECT {
+    MATCH ()-[existing_rel:RELATED]->() WHERE existing_rel.sequence_id IS NOT NULL
+    RETURN existing_rel.sequence_id ORDER BY existing_rel.sequence_id DESC LIMIT 1
+}), -1) AS max_seq_id
+UNWIND $indices AS node_pair
+MATCH (s:Entity {sequence_id: node_pair[0]})
+MATCH (t:Entity {sequence_id: node_pair[1]})
+WITH max_seq_id, collect([s, t]) AS pairs
+UNWIND range(0, size(pairs) - 1) AS idx
+CALL {
+    WITH max_seq_id, idx, pairs
+    WITH max_seq_id, idx, pairs[idx][0] AS s, pairs[idx][1] AS t
+    CREATE (s)-[r:RELATED]->(t)
+    SET r.sequence_id = max_seq_id + idx + 1
+    RETURN r.sequence_id AS sequence_id
+} IN TRANSACTIONS OF 5000 ROWS
+RETURN sequence_id
+"""
+
+# Both endpoints are seeks on the entity_name constraint, EXISTS stops at the first relationship
+_CYPHER_ARE_NEIGHBOURS = """
+MATCH (s:Entity {name: $source}), (t:Entity {name: $target})
+RETURN EXISTS { (s)-[:RELATED]-(t) } AS connected
+"""
+
+# UNWIND keeps the order of $pairs, a pair with a missing endpoint is not connected
+_CYPHER_ARE_NEIGHBOURS_MANY = """
+UNWIND $pairs AS pair
+RETURN EXISTS { (:Entity {name: pair[0]})-[:RELATED]-(:Entity {name: pair[1]}) } AS connected
+"""
+
+# Each ID is a seek on the relationship sequence_id index; large deletes are committed in chunks.
+# CALL {} IN TRANSACTIONS only runs in auto-commit transactions (session.run)
+_CYPHER_DELETE_EDGES = """
+UNWIND $sequence_ids AS sequence_id
+CALL {
+    WITH sequence_id
+    MATCH ()-[r:RELATED {sequence_id: sequence_id}]->()
+    DELETE r
+} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+_CYPHER_CONSTRAINT_NAMES = "SHOW CONSTRAINTS YIELD name RETURN collect(name) AS names"
+
+# Use Neo4j GDS library for PageRank algorithm
+_CYPHER_CREATE_GDS_GRAPH = """
+CALL gds.graph.project(
+    $graph_name,
+    'Entity',
+    {
+        RELATED: {
+            orientation: 'UNDIRECTED'
+        }
+    }
+)
+"""
+
+# GDS node ids are internal, scores are placed by the node sequence ID instead.
+# The scores are collected server-side into one record of two lists rather than streamed as one record per node
+_CYPHER_PAGERANK = """
+CALL { MATCH (n:Entity) RETURN count(n) AS node_count }
+CALL gds.pageRank.stream($graph_name, {
+    dampingFactor: $damping,
+    maxIterations: 20
+})
+YIELD nodeId, score
+WITH node_count, gds.util.asNode(nodeId).sequence_id AS node_seq_id, score
+WHERE node_seq_id IS NOT NULL
+RETURN node_count, collect(node_seq_id) AS node_seq_ids, collect(score) AS scores
+"""
+
+_CYPHER_GDS_GRAPH_EXISTS = """
+CALL gds.graph.exists($graph_name) YIELD exists
+RETURN exists
+"""
+
+# COUNT {} reads each node's degree directly instead of expanding every relationship into a row
+_CYPHER_DEGREES = """
+WITH coalesce(head(COLLECT {
+    MATCH (existing:Entity) WHERE existing.sequence_id IS NOT NULL
+    RETURN existing.sequence_id ORDER BY existing.sequence_id DESC LIMIT 1
+}), -1) + 1 AS size
+MATCH (n:Entity)
+WHERE n.sequence_id IS NOT NULL
+RETURN size, n.sequence_id AS node_seq_id, COUNT { (n)-[:RELATED]-() } AS degree
+"""
+
+# Counts and (node, edge) incidence pairs come back in a single record, the pairs as two flat lists
+_CYPHER_ENTITIES_TO_RELATIONSHIPS = """
+CALL { MATCH (n:Entity) RETURN count(n) AS node_count }
+CALL { MATCH ()-[r:RELATED]->() RETURN count(r) AS edge_count }
+CALL {
+    MATCH (n:Entity)-[r:RELATED]-()
+    WHERE n.sequence_id IS NOT NULL AND r.sequence_id IS NOT NULL
+    WITH DISTINCT n.sequence_id AS node_seq_id, r.sequence_id AS edge_seq_id
+    RETURN collect(node_seq_id) AS node_seq_ids, collect(edge_seq_id) AS edge_seq_ids
+}
+RETURN node_count, edge_count, node_seq_ids, edge_seq_ids
+"""
+
+_CYPHER_RELATIONSHIPS_SIZE = """
+RETURN coalesce(head(COLLECT {
+    MATCH ()-[existing_rel:RELATED]->() WHERE existing_rel.sequence_id IS NOT NULL
+    RETURN existing_rel.sequence_id ORDER BY existing_rel.sequence_id DESC LIMIT 1
+}), -1) + 1 AS size
+"""
+
+# The key is passed as a parameter (r[$key]) so the plan is cached across keys and nothing is interpolated.
+# Paged by sequence ID (an index range seek) rather than SKIP, which rescans every previous page.
+_CYPHER_RELATIONSHIPS_ATTRS = """
+MATCH ()-[r:RELATED]->()
+WHERE r.sequence_id > $after
+RETURN r[$key] AS attr_value, r.sequence_id AS edge_seq_id
+ORDER BY r.sequence_id
+LIMIT $batch_size
+"""
+
+# Bulk writes pull at most this many items from the caller's iterable per statement
+_WRITE_CHUNK_SIZE = 5000
+
+# Number of (source, target) pairs remembered by are_neighbours
+_NEIGHBOURS_CACHE_SIZE = 1024
+# Number of nodes (by name) and edges (by sequence ID) remembered by the point lookups
+_ENTITY_CACHE_SIZE = 10000
+
+def _lru_put(cache: "OrderedDict[Any, Any]", key: Any, value: Any, maxsize: int) -> None:
+    """Store a value in an OrderedDict used as an LRU cache, evicting the oldest entry when full."""
+    cache[key] = value
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def _serialize_value(value: Any) -> Any:
+    """Serialize a nested collection to a JSON string, Neo4j properties only hold flat lists of primitives."""
+    if isinstance(value, np.ndarray):
+        # Converted in one go instead of element by element
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        # Check if it's a nested collection
+        if value and isinstance(value[0], (list, tuple, dict)):
+            return json.dumps(value)
+        return value
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return value
+
+
+def _properties_getter(names: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+    """Build a shallow field extractor: one attrgetter call per object, no recursive copy like asdict.
+
+    The values are serialized for Neo4j in the same pass, so each object is turned into a single dict.
+    """
+    if not names:
+        return lambda obj: {}
+    if len(names) == 1:
+        # attrgetter with a single name returns the bare value instead of a tuple
+        name = names[0]
+        return lambda obj: {name: _serialize_value(getattr(obj, name))}
+    getter = attrgetter(*names)
+    return lambda obj: {name: _serialize_value(value) for name, value in zip(names, getter(obj))}
+
+
+# Storages with an open driver, closed at interpreter exit without keeping them alive.
+# Keyed by id() because dataclass instances are not hashable
+_OPEN_STORAGES: "weakref.WeakValueDictionary[int, Neo4jStorage[Any, Any]]" = weakref.WeakValueDictionary()
+
+
+@atexit.register
+def _close_open_storages() -> None:
+    for storage in list(_OPEN_STORAGES.values()):
+        try:
+            storage.close()
+        except Exception as e:
+            logger.debug(f"Failed to close Neo4j storage at exit: {e}")
+
+
+async def _close_driver_on_cancel(driver: AsyncDriver) -> None:
+    """Keep a driver open until cancelled, then close it on the event loop that owns it.
+
+    asyncio.run cancels the tasks still pending when its main coroutine returns, so the driver of a loop
+    that is shutting down (e.g. after one request of a service calling asyncio.run per request) releases
+    its connection pool before the loop is closed.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await driver.close()
+
+
+# Nested collections are stored as JSON strings, which always start with one of these
+_JSON_CONTAINER_PREFIXES = ("[", "{")
+
+# Returned by score_nodes for an empty graph. Shared between calls, so it must not be modified in place
+_EMPTY_SCORES = csr_matrix((1, 0), dtype=TScore)
+
+
+def _scores_to_csr(scores: np.ndarray) -> csr_matrix:
+    """Build the (1, #nodes) score matrix directly from the non-zero entries of a dense score vector.
+
+    The matrix keeps the dtype of the vector, so the float32 score buffers are never widened to float64.
+    """
+    nonzero = np.flatnonzero(scores)
+    return csr_matrix(
+        (scores[nonzero], nonzero, np.array([0, nonzero.size])),
+        shape=(1, scores.size),
+    )
+
+
 @dataclass
 class Neo4jStorageConfig(Generic[GTNode, GTEdge]):
     """Configuration for Neo4j graph storage."""
@@ -30,118 +456,258 @@ class Neo4jStorageConfig(Generic[GTNode, GTEdge]):
     database: str = field(default="neo4j")
     ppr_damping: float = field(default=0.85)
     max_connections: int = field(default=10)
-    encrypted: bool = field(default=True)
+    connection_acquisition_timeout: float = field(default=60.0)
+    encrypted: bool = field(default=False)
     trust: str = field(default="TRUST_ALL_CERTIFICATES")
 
 
 @dataclass
 class Neo4jStorage(BaseGraphStorage[GTNode, GTEdge, GTId]):
     """Neo4j implementation of graph storage for scalable production use."""
-    
+
     config: Neo4jStorageConfig[GTNode, GTEdge] = field()
-    _driver: Driver = field(init=False)
+    _driver: Optional[AsyncDriver] = field(init=False, default=None)
+    # The async driver (and its connection pool) is bound to the event loop that created it
+    _driver_loop: Optional[asyncio.AbstractEventLoop] = field(init=False, default=None)
+    # Task running _close_driver_on_cancel for the current driver; cancelling it closes the driver
+    _driver_closer: Optional["asyncio.Task[None]"] = field(init=False, default=None)
+    # Serializes the writes that allocate new sequence IDs (read the current max, then create)
+    _write_lock: Optional[asyncio.Lock] = field(init=False, default=None)
+    # Upserts issued concurrently are buffered here and written together with a single UNWIND statement
+    _pending_nodes: List[Tuple[Dict[str, Any], "asyncio.Future[TIndex]"]] = field(init=False, default_factory=list)
+    _pending_edges: List[Tuple[Dict[str, Any], TIndex, "asyncio.Future[TIndex]"]] = field(
+        init=False, default_factory=list
+    )
+    # Flushes of those buffers run as tasks owned by the storage, referenced here until they finish
+    _flush_tasks: Set["asyncio.Task[None]"] = field(init=False, default_factory=set)
+    # Sequence ID uniqueness constraints that could not be created, so that later insert phases keep the plain
+    # index instead of dropping and rebuilding it every time
+    _failed_constraints: Set[str] = field(init=False, default_factory=set)
+    # Set by writes until the database-wide graph version has been bumped, which invalidates the GDS projection
+    _graph_changes_unpublished: bool = field(init=False, default=False)
+    # Database-wide graph version the cached graph state below belongs to; other storages may change the graph
+    _seen_graph_version: Optional[int] = field(init=False, default=None)
+    # Recent are_neighbours answers, dropped whenever the graph changes
+    _neighbours_cache: "OrderedDict[Tuple[Any, Any], bool]" = field(init=False, default_factory=OrderedDict)
+    # Recent get_node / get_edge_by_index results, dropped for the entries that are written and whenever
+    # another storage changed the graph
+    _node_cache: "OrderedDict[Any, Tuple[GTNode, TIndex]]" = field(init=False, default_factory=OrderedDict)
+    _edge_cache: "OrderedDict[TIndex, GTEdge]" = field(init=False, default_factory=OrderedDict)
+    # get_relationships_attrs results per key, dropped whenever an edge is written
+    _relationships_attrs_cache: Dict[str, List[List[Any]]] = field(init=False, default_factory=dict)
+    # node_count / edge_count results, dropped whenever the graph changes
+    _node_count_cache: Optional[int] = field(init=False, default=None)
+    _edge_count_cache: Optional[int] = field(init=False, default=None)
+    # Bumped by every invalidation, so that a count read concurrently with a write is not cached
+    _graph_version: int = field(init=False, default=0)
+    # Field names of the node/edge classes, used instead of asdict (which deep-copies every value)
+    _node_fields: Tuple[str, ...] = field(init=False, default=())
+    _edge_fields: Tuple[str, ...] = field(init=False, default=())
+    # Serialized property maps of a node/edge object, ready to be sent to Neo4j
+    _node_properties: Callable[[Any], Dict[str, Any]] = field(init=False, default=None)  # type: ignore
+    _edge_properties: Callable[[Any], Dict[str, Any]] = field(init=False, default=None)  # type: ignore
 
     def __post_init__(self):
-        """Initialize Neo4j driver after dataclass creation."""
-        self._init_driver()
+        self._node_fields = tuple(f.name for f in fields(self.config.node_cls))
+        self._edge_fields = tuple(f.name for f in fields(self.config.edge_cls) if f.name not in ("source", "target"))
+        self._node_properties = _properties_getter(self._node_fields)
+        self._edge_properties = _properties_getter(self._edge_fields)
 
     def _init_driver(self):
         """Initialize Neo4j driver with configuration."""
+        # Security settings are only accepted for plain bolt:// and neo4j:// URIs, the +s/+ssc schemes imply them
+        security: Dict[str, Any] = {}
+        if "+s" not in self.config.uri.split("://", 1)[0]:
+            security["encrypted"] = self.config.encrypted
+            if self.config.encrypted:
+                security["trust"] = self.config.trust
         try:
-            print("Connecting to Neo4j...", self.config)
-            self._driver = GraphDatabase.driver(
+            self._driver = AsyncGraphDatabase.driver(
                 self.config.uri,
                 auth=basic_auth(self.config.username, self.config.password),
+                max_connection_pool_size=self.config.max_connections,
+                connection_acquisition_timeout=self.config.connection_acquisition_timeout,
+                keep_alive=True,
+                **security,
             )
+            self._driver_loop = asyncio.get_running_loop()
+            self._driver_closer = self._driver_loop.create_task(_close_driver_on_cancel(self._driver))
+            self._write_lock = asyncio.Lock()
+            _OPEN_STORAGES[id(self)] = self
             logger.info(f"Connected to Neo4j at {self.config.uri}")
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}", e)
             raise InvalidStorageError(f"Neo4j connection failed: {e}")
 
+    def _ensure_driver(self) -> None:
+        """Create the driver for the running event loop if needed."""
+        if self._driver is None or self._driver_loop is not asyncio.get_running_loop():
+            # The storage may be driven by several event loops (e.g. one asyncio.run per request)
+            self._release_driver()
+            self._init_driver()
+
+    def _release_driver(self) -> None:
+        """Forget the current driver, closing it on the event loop that owns it."""
+        closer, loop = self._driver_closer, self._driver_loop
+        self._driver = None
+        self._driver_loop = None
+        self._driver_closer = None
+        _OPEN_STORAGES.pop(id(self), None)
+        if closer is None or closer.done() or loop is None or loop.is_closed():
+            # Already closed, or closed when its loop shut down (asyncio.run cancels pending tasks)
+            return
+        # Runs as soon as the owning loop gets control again, whichever thread it runs on
+        loop.call_soon_threadsafe(closer.cancel)
+
+    def _mark_graph_changed(self) -> None:
+        """Invalidate the state derived from the graph topology."""
+        self._graph_changes_unpublished = True
+        self._neighbours_cache.clear()
+        self._relationships_attrs_cache.clear()
+        self._node_count_cache = None
+        self._edge_count_cache = None
+        self._graph_version += 1
+
+    def _drop_cached_graph_state(self) -> None:
+        """Drop the cached graph state after another storage changed the graph."""
+        self._neighbours_cache.clear()
+        self._relationships_attrs_cache.clear()
+        self._node_cache.clear()
+        self._edge_cache.clear()
+        self._node_count_cache = None
+        self._edge_count_cache = None
+        # Counts read concurrently belong to the old graph as well
+        self._graph_version += 1
+
+    def _sync_graph_version(self, version: int, bumped: bool = False) -> None:
+        """Record the database-wide graph version, dropping the cached graph state if it moved unexpectedly.
+
+        A version bumped by this storage is expected to be one past the last one seen; any other
+        difference means another storage changed the graph in the meantime.
+        """
+        expected = self._seen_graph_version
+        if bumped and expected is not None:
+            expected += 1
+        if version != expected:
+            self._drop_cached_graph_state()
+        self._seen_graph_version = version
+
+    def _session(self) -> AsyncSession:
+        """Open a session on the driver of the running event loop.
+
+        Async sessions cannot be shared by concurrent coroutines, so each call opens its own session;
+        the bolt connections themselves are reused through the driver pool.
+        """
+        self._ensure_driver()
+        return self._driver.session(database=self.config.database)  # type: ignore
+
+    def _sequence_lock(self) -> asyncio.Lock:
+        """Lock held by the writes that allocate new sequence IDs."""
+        self._ensure_driver()
+        return self._write_lock  # type: ignore
+
+    async def _run(self, query: str, routing: RoutingControl, **params: Any) -> List[Record]:
+        """Run a single query in a managed transaction and return all its records.
+
+        driver.execute_query borrows a pooled connection for just this query, without a session of our own.
+        Managed transactions are retried by the driver on transient errors (leader switch, deadlock,
+        dropped connection), so the work functions passed to execute_read/execute_write must be idempotent.
+        """
+        self._ensure_driver()
+        result = await self._driver.execute_query(  # type: ignore
+            query, parameters_=params, routing_=routing, database_=self.config.database
+        )
+        return result.records
+
+    async def _read_single(self, query: str, **params: Any) -> Optional[Record]:
+        """Run a read query and return its first record."""
+        records = await self._run(query, RoutingControl.READ, **params)
+        return records[0] if records else None
+
+    async def _write_single(self, query: str, **params: Any) -> Optional[Record]:
+        """Run a write query and return its first record."""
+        records = await self._run(query, RoutingControl.WRITE, **params)
+        return records[0] if records else None
+
     async def _get_node_sequence_id(self, node_name: str) -> int:
         """Get or create a sequence ID for a node using database-stored counter."""
-        cypher = """
-        OPTIONAL MATCH (existing:Entity)
-        WITH coalesce(max(existing.sequence_id), -1) + 1 AS next_id
-        MERGE (n:Entity {name: $node_name})
-        ON CREATE SET n.sequence_id = next_id
-        ON MATCH SET n.sequence_id = coalesce(n.sequence_id, next_id)
-        RETURN n.sequence_id as sequence_id
-        """
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, node_name=node_name)
-            record = result.single()
-            if record is None:
-                raise RuntimeError(f"Failed to get or create sequence ID for node: {node_name}")
-            return record["sequence_id"]
+        self._mark_graph_changed()
+        self._node_cache.pop(node_name, None)
+        async with self._sequence_lock():
+            record = await self._write_single(_CYPHER_NODE_SEQUENCE_ID, node_name=node_name)
+        if record is None:
+            raise RuntimeError(f"Failed to get or create sequence ID for node: {node_name}")
+        return record["sequence_id"]
 
     async def _get_edge_sequence_id(self, source_name: str, target_name: str, relationship_type: str = "RELATED") -> int:
         """Get or create a sequence ID for an edge using database-stored counter."""
-        cypher = """
-        MATCH (s:Entity {name: $source_name}), (t:Entity {name: $target_name})
-        OPTIONAL MATCH ()-[existing_rel:RELATED]->()
-        WITH s, t, coalesce(max(existing_rel.sequence_id), -1) + 1 AS next_id
-        MERGE (s)-[r:RELATED]->(t)
-        ON CREATE SET r.sequence_id = next_id
-        ON MATCH SET r.sequence_id = coalesce(r.sequence_id, next_id)
-        RETURN r.sequence_id as sequence_id
-        """
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, source_name=source_name, target_name=target_name)
-            record = result.single()
-            if record is None:
-                raise RuntimeError(f"Failed to get or create sequence ID for edge: {source_name} -> {target_name}")
-            return record["sequence_id"]
+        self._mark_graph_changed()
+        self._edge_cache.clear()
+        async with self._sequence_lock():
+            record = await self._write_single(_CYPHER_EDGE_SEQUENCE_ID, source_name=source_name, target_name=target_name)
+        if record is None:
+            raise RuntimeError(f"Failed to get or create sequence ID for edge: {source_name} -> {target_name}")
+        return record["sequence_id"]
 
     async def _get_node_by_sequence_id(self, sequence_id: int) -> Optional[str]:
         """Get node name by sequence ID."""
-        cypher = """
-        MATCH (n:Entity {sequence_id: $sequence_id})
-        RETURN n.name as name
-        """
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, sequence_id=sequence_id)
-            record = result.single()
-            return record["name"] if record else None
+        record = await self._read_single(_CYPHER_NODE_NAME_BY_SEQUENCE_ID, sequence_id=sequence_id)
+        return record["name"] if record else None
 
     async def _get_edge_by_sequence_id(self, sequence_id: int) -> Optional[Tuple[str, str]]:
         """Get edge source and target names by sequence ID."""
-        cypher = """
-        MATCH (s:Entity)-[r:RELATED {sequence_id: $sequence_id}]->(t:Entity)
-        RETURN s.name as source_name, t.name as target_name
-        """
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, sequence_id=sequence_id)
-            record = result.single()
-            return (record["source_name"], record["target_name"]) if record else None
+        record = await self._read_single(_CYPHER_EDGE_NAMES_BY_SEQUENCE_ID, sequence_id=sequence_id)
+        return (record["source_name"], record["target_name"]) if record else None
 
     async def save_graphml(self, path: str) -> None:
         """Export graph to GraphML format."""
-        cypher = """
-        CALL apoc.export.graphml.all($file, {})
+        # Written part by part as the records arrive, the whole document is never held in memory at once
+        async with self._session() as session:
+            result = await session.run(_CYPHER_EXPORT_GRAPHML)
+            with open(path, "w", encoding="utf-8") as f:
+                async for record in result:
+                    if record["data"]:
+                        f.write(record["data"])
+
+    async def _read_count(self, query: str) -> Tuple[int, bool]:
+        """Run a count query and tell whether its result may be cached.
+
+        Only counts read while no write was allocating sequence IDs and no invalidation happened
+        in the meantime are safe to keep.
         """
-        with self._driver.session(database=self.config.database) as session:
-            session.run(cypher, file=path)
+        cacheable = not self._sequence_lock().locked()
+        version = self._graph_version
+        record = await self._read_single(query)
+        count = record["count"] if record else 0
+        return count, cacheable and version == self._graph_version
 
     async def node_count(self) -> int:
         """Get total number of nodes in the graph."""
-        cypher = "MATCH (n:Entity) RETURN count(n) as count"
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher)
-            record = result.single()
-            if record is None:
-                return 0
-            return record["count"]
+        if self._node_count_cache is None:
+            count, cacheable = await self._read_count(_CYPHER_NODE_COUNT)
+            if not cacheable:
+                return count
+            self._node_count_cache = count
+        return self._node_count_cache
 
     async def edge_count(self) -> int:
         """Get total number of edges in the graph."""
-        cypher = "MATCH ()-[r:RELATED]->() RETURN count(r) as count"
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher)
-            record = result.single()
-            if record is None:
-                return 0
-            return record["count"]
+        if self._edge_count_cache is None:
+            count, cacheable = await self._read_count(_CYPHER_EDGE_COUNT)
+            if not cacheable:
+                return count
+            self._edge_count_cache = count
+        return self._edge_count_cache
+
+    def _node_from_properties(self, node_data: Dict[str, Any]) -> GTNode:
+        """Build a node object from the properties stored in Neo4j."""
+        # Deserialize nested collections
+        node_data = self._deserialize_nested_collections(node_data)
+
+        # Remove sequence_id from node data as it's internal
+        node_data.pop('sequence_id', None)
+
+        return self.config.node_cls(**node_data)
 
     async def get_node(self, node: Union[GTNode, GTId]) -> Union[Tuple[GTNode, TIndex], Tuple[None, None]]:
         """Retrieve a node by its identifier."""
@@ -150,220 +716,274 @@ class Neo4jStorage(BaseGraphStorage[GTNode, GTEdge, GTId]):
         else:
             node_id = node
 
-        cypher = """
-        MATCH (n:Entity {name: $node_id})
-        RETURN n, n.sequence_id as sequence_id
-        """
-        print("Fetching node by ID:", node_id)
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, node_id=node_id)
-            record = result.single()
-            
-            if record:
-                node_data = dict(record["n"])
-                # Deserialize nested collections
-                node_data = self._deserialize_nested_collections(node_data)
-                
-                # Remove sequence_id from node data as it's internal
-                node_data.pop('sequence_id', None)
-                
-                node_obj = self.config.node_cls(**node_data)
-                sequence_id = record["sequence_id"]
-                return (node_obj, sequence_id)
-            
-            return (None, None)
+        return (await self.get_nodes([node_id]))[0]
+
+    async def get_nodes(
+        self, node_ids: Sequence[GTId]
+    ) -> List[Union[Tuple[GTNode, TIndex], Tuple[None, None]]]:
+        """Retrieve several nodes by identifier with a single query, in the order of the identifiers."""
+        found: Dict[Any, Tuple[GTNode, TIndex]] = {}
+        missing: List[GTId] = []
+        for node_id in node_ids:
+            cached = self._node_cache.get(node_id)
+            if cached is not None:
+                self._node_cache.move_to_end(node_id)
+                found[node_id] = cached
+            else:
+                missing.append(node_id)
+
+        if missing:
+            records = await self._run(_CYPHER_GET_NODES, RoutingControl.READ, ids=list(dict.fromkeys(missing)))
+            for node_id, node_data, sequence_id in records:
+                if node_data is None:
+                    continue
+                found[node_id] = (self._node_from_properties(node_data), sequence_id)
+                _lru_put(self._node_cache, node_id, found[node_id], _ENTITY_CACHE_SIZE)
+
+        return [found.get(node_id, (None, None)) for node_id in node_ids]
 
     async def get_edges(
         self, source_node: Union[GTId, TIndex], target_node: Union[GTId, TIndex]
     ) -> Iterable[Tuple[GTEdge, TIndex]]:
         """Get all edges between two nodes."""
-        cypher = """
-        MATCH (s:Entity)-[r:RELATED]->(t:Entity)
-        WHERE s.name = $source AND t.name = $target
-        RETURN r, r.sequence_id as sequence_id, s.name as source_name, t.name as target_name
-        """
-        
+        records = await self._run(_CYPHER_GET_EDGES, RoutingControl.READ, source=source_node, target=target_node)
+
         edges: List[Tuple[GTEdge, TIndex]] = []
-        
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, source=source_node, target=target_node)
-            
-            for record in result:
-                edge_data = dict(record["r"])
-                edge_data["source"] = record["source_name"]
-                edge_data["target"] = record["target_name"]
-                
-                # Deserialize nested collections
-                edge_data = self._deserialize_nested_collections(edge_data)
-                
-                # Remove sequence_id from edge data as it's internal
-                edge_data.pop('sequence_id', None)
-                
-                edge_obj = self.config.edge_cls(**edge_data)
-                sequence_id = record["sequence_id"]
-                edges.append((edge_obj, sequence_id))
-        
+        for record in records:
+            # Records are tuples, unpacking them skips the per-key lookups
+            edge_data, sequence_id, source_name, target_name = record
+            edge_data["source"] = source_name
+            edge_data["target"] = target_name
+
+            # Deserialize nested collections
+            edge_data = self._deserialize_nested_collections(edge_data)
+
+            # Remove sequence_id from edge data as it's internal
+            edge_data.pop('sequence_id', None)
+
+            edge_obj = self.config.edge_cls(**edge_data)
+            edges.append((edge_obj, sequence_id))
         return edges
 
     async def get_node_by_index(self, index: TIndex) -> Union[GTNode, None]:
         """Get node by sequence ID."""
-        cypher = """
-        MATCH (n:Entity {sequence_id: $sequence_id})
-        RETURN n
-        """
-        
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, sequence_id=index)
-            record = result.single()
-            
-            if record:
-                node_data = dict(record["n"])
-                # Deserialize nested collections
-                node_data = self._deserialize_nested_collections(node_data)
-                
-                # Remove sequence_id from node data as it's internal
-                node_data.pop('sequence_id', None)
-                
-                return self.config.node_cls(**node_data)
-            
-            return None
+        return (await self.get_nodes_by_index([index]))[0]
+
+    async def get_nodes_by_index(self, indices: Iterable[TIndex]) -> List[Union[GTNode, None]]:
+        """Get several nodes by sequence ID with a single query, in the order of the IDs."""
+        sequence_ids = [int(index) for index in indices]
+        if not sequence_ids:
+            return []
+
+        records = await self._run(
+            _CYPHER_GET_NODES_BY_INDEX, RoutingControl.READ, sequence_ids=list(dict.fromkeys(sequence_ids))
+        )
+        found: Dict[int, GTNode] = {
+            sequence_id: self._node_from_properties(node_data)
+            for sequence_id, node_data in records
+            if node_data is not None
+        }
+        return [found.get(sequence_id) for sequence_id in sequence_ids]
 
     async def get_edge_by_index(self, index: TIndex) -> Union[GTEdge, None]:
         """Get edge by sequence ID."""
-        cypher = """
-        MATCH (s:Entity)-[r:RELATED {sequence_id: $sequence_id}]->(t:Entity)
-        RETURN r, s.name as source_name, t.name as target_name
-        """
-        
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, sequence_id=index)
-            record = result.single()
-            
-            if record:
-                edge_data = dict(record["r"])
-                edge_data["source"] = record["source_name"]
-                edge_data["target"] = record["target_name"]
-                
+        return (await self.get_edges_by_index([index]))[0]
+
+    async def get_edges_by_index(self, indices: Iterable[TIndex]) -> List[Union[GTEdge, None]]:
+        """Get several edges by sequence ID with a single query, in the order of the IDs."""
+        sequence_ids = [int(index) for index in indices]
+        found: Dict[int, GTEdge] = {}
+        missing: List[int] = []
+        for sequence_id in sequence_ids:
+            cached = self._edge_cache.get(sequence_id)
+            if cached is not None:
+                self._edge_cache.move_to_end(sequence_id)
+                found[sequence_id] = cached
+            else:
+                missing.append(sequence_id)
+
+        if missing:
+            records = await self._run(
+                _CYPHER_GET_EDGES_BY_INDEX, RoutingControl.READ, sequence_ids=list(dict.fromkeys(missing))
+            )
+            for sequence_id, edge_data, source_name, target_name in records:
+                if edge_data is None:
+                    continue
+                edge_data["source"] = source_name
+                edge_data["target"] = target_name
+
                 # Deserialize nested collections
                 edge_data = self._deserialize_nested_collections(edge_data)
-                
+
                 # Remove sequence_id from edge data as it's internal
                 edge_data.pop('sequence_id', None)
-                
-                return self.config.edge_cls(**edge_data)
-            
-            return None
+
+                found[sequence_id] = self.config.edge_cls(**edge_data)
+                _lru_put(self._edge_cache, sequence_id, found[sequence_id], _ENTITY_CACHE_SIZE)
+
+        return [found.get(sequence_id) for sequence_id in sequence_ids]
 
     async def upsert_node(self, node: GTNode, node_index: Union[TIndex, None]) -> TIndex:
         """Insert or update a node."""
-        node_data = asdict(node)
-        
-        # Serialize nested collections
-        node_data = self._serialize_nested_collections(node_data)
-        
-        print("Upserting node:", node_data, "Index:", node_index)
-        if node_index is not None:
-            # Update existing node by sequence ID
-            cypher = """
-            MATCH (n:Entity {sequence_id: $sequence_id})
-            SET n += $properties
-            RETURN n.sequence_id as sequence_id
-            """
-            
-            with self._driver.session(database=self.config.database) as session:
-                result = session.run(cypher, sequence_id=node_index, properties=node_data)
-                record = result.single()
-                return record["sequence_id"] if record else node_index
-        else:
-            # Create new node with auto-generated sequence ID
-            cypher = """
-            OPTIONAL MATCH (existing:Entity)
-            WITH coalesce(max(existing.sequence_id), -1) + 1 AS next_id
-            MERGE (n:Entity {name: $name})
-            ON CREATE SET n.sequence_id = next_id
-            ON MATCH SET n.sequence_id = coalesce(n.sequence_id, next_id)
-            SET n += $properties
-            RETURN n.sequence_id as sequence_id
-            """
-            
-            with self._driver.session(database=self.config.database) as session:
-                result = session.run(
-                    cypher, 
-                    name=node_data.get("name"), 
-                    properties=node_data
-                )
-                record = result.single()
-                if record is None:
-                    raise RuntimeError(f"Failed to upsert node: {node_data.get('name')}")
-                return record["sequence_id"]
+        node_data = self._node_properties(node)
+
+        future: asyncio.Future[TIndex] = asyncio.get_running_loop().create_future()
+        self._pending_nodes.append((node_data, future))
+        if len(self._pending_nodes) == 1:
+            # First upsert of a batch: the flush task starts on the next loop iteration, so concurrent
+            # callers join the batch, and cancelling this caller cannot leave the others waiting
+            self._spawn_flush(self._flush_pending_nodes)
+        return await future
+
+    async def upsert_nodes(self, nodes: Iterable[GTNode]) -> List[TIndex]:
+        """Insert or update several nodes with a single UNWIND statement and return their sequence IDs."""
+        loop = asyncio.get_running_loop()
+        futures: List[asyncio.Future[TIndex]] = []
+        for node in nodes:
+            future: asyncio.Future[TIndex] = loop.create_future()
+            self._pending_nodes.append((self._node_properties(node), future))
+            futures.append(future)
+        if not futures:
+            return []
+
+        # Also writes the upserts other callers buffered in the meantime
+        await self._flush_pending_nodes()
+        return list(await asyncio.gather(*futures))
+
+    def _spawn_flush(self, flush: Callable[[], Awaitable[None]]) -> None:
+        """Run a flush of the upsert buffers in a task owned by the storage rather than by one caller."""
+        task = asyncio.get_running_loop().create_task(flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_pending_nodes(self) -> None:
+        """Write all buffered node upserts and resolve their sequence IDs.
+
+        Large batches are written as one transaction per chunk so that no single transaction holds the locks
+        (and the transaction state) of the whole batch.
+        """
+        pending, self._pending_nodes = self._pending_nodes, []
+        if not pending:
+            return
+
+        for node_data, _ in pending:
+            self._node_cache.pop(node_data.get("name"), None)
+
+        try:
+            # A batch flushed while another one is in flight must see its sequence IDs
+            async with self._sequence_lock(), self._session() as session:
+                for start in range(0, len(pending), _WRITE_CHUNK_SIZE):
+                    chunk = pending[start : start + _WRITE_CHUNK_SIZE]
+                    # A name repeated in a later chunk finds the sequence ID committed by the earlier one
+                    sequence_ids = await session.execute_write(self._upsert_nodes_work, chunk)
+                    self._mark_graph_changed()
+                    for node_data, future in chunk:
+                        if not future.done():
+                            future.set_result(sequence_ids[node_data.get("name")])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Only reached with unresolved futures if the flush itself was cancelled
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(InvalidStorageError("Neo4j node upsert batch was interrupted"))
+
+    @staticmethod
+    async def _upsert_nodes_work(
+        tx: AsyncManagedTransaction, pending: List[Tuple[Dict[str, Any], "asyncio.Future[TIndex]"]]
+    ) -> Dict[Any, TIndex]:
+        """Upsert a chunk of buffered nodes, allocating sequence IDs to the new ones."""
+        names = list(dict.fromkeys(node_data.get("name") for node_data, _ in pending))
+        # Allocated inside the transaction function so that a retry allocates again from the current maximum
+        sequence_ids: Dict[Any, TIndex] = {}
+        next_id = 0
+        result = await tx.run(_CYPHER_LOOKUP_NODES, names=names)
+        async for record in result:
+            next_id = record["max_seq_id"] + 1
+            if record["sequence_id"] is not None:
+                sequence_ids[record["name"]] = record["sequence_id"]
+        for name in names:
+            if name not in sequence_ids:
+                sequence_ids[name] = TIndex(next_id)
+                next_id += 1
+
+        rows = [
+            {
+                "name": node_data.get("name"),
+                "sequence_id": sequence_ids[node_data.get("name")],
+                "properties": node_data,
+            }
+            for node_data, _ in pending
+        ]
+        result = await tx.run(_CYPHER_UPSERT_NODES, rows=rows)
+        await result.consume()
+        return sequence_ids
 
     async def upsert_edge(self, edge: GTEdge, edge_index: Union[TIndex, None]) -> TIndex:
         """Insert or update an edge."""
-        edge_data = asdict(edge)
-        source = edge_data.pop("source")
-        target = edge_data.pop("target")
-        
-        # Serialize nested collections
-        edge_data = self._serialize_nested_collections(edge_data)
-        
+        source = edge.source  # type: ignore
+        target = edge.target  # type: ignore
+        edge_data = self._edge_properties(edge)
+
         if edge_index is not None:
-            # Update existing edge by sequence ID
-            cypher = """
-            MATCH (s:Entity)-[r:RELATED {sequence_id: $sequence_id}]->(t:Entity)
-            SET r += $properties
-            RETURN r.sequence_id as sequence_id
-            """
-            
-            with self._driver.session(database=self.config.database) as session:
-                result = session.run(cypher, sequence_id=edge_index, properties=edge_data)
-                record = result.single()
-                return record["sequence_id"] if record else edge_index
+            # Update existing edge by sequence ID, batched with the other concurrent updates
+            future: asyncio.Future[TIndex] = asyncio.get_running_loop().create_future()
+            self._pending_edges.append((edge_data, edge_index, future))
+            if len(self._pending_edges) == 1:
+                self._spawn_flush(self._flush_pending_edges)
+            return await future
         else:
             # Create new edge with auto-generated sequence ID
-            cypher = """
-            MATCH (s:Entity {name: $source}), (t:Entity {name: $target})
-            OPTIONAL MATCH ()-[existing_rel:RELATED]->()
-            WITH s, t, coalesce(max(existing_rel.sequence_id), -1) + 1 AS next_id
-            MERGE (s)-[r:RELATED]->(t)
-            ON CREATE SET r.sequence_id = next_id
-            ON MATCH SET r.sequence_id = coalesce(r.sequence_id, next_id)
-            SET r += $properties
-            RETURN r.sequence_id as sequence_id
-            """
-            
-            with self._driver.session(database=self.config.database) as session:
-                result = session.run(
-                    cypher, 
-                    source=source, 
-                    target=target, 
+            self._mark_graph_changed()
+            self._edge_cache.clear()
+            async with self._sequence_lock():
+                record = await self._write_single(
+                    _CYPHER_CREATE_EDGE,
+                    source=source,
+                    target=target,
                     properties=edge_data
                 )
-                record = result.single()
-                if record is None:
-                    raise RuntimeError(f"Failed to upsert edge: {source} -> {target}")
-                return record["sequence_id"]
+            if record is None:
+                raise RuntimeError(f"Failed to upsert edge: {source} -> {target}")
+            return record["sequence_id"]
+
+    async def _flush_pending_edges(self) -> None:
+        """Write all buffered edge updates in one statement."""
+        pending, self._pending_edges = self._pending_edges, []
+        if not pending:
+            return
+
+        self._relationships_attrs_cache.clear()
+        for _, edge_index, _ in pending:
+            self._edge_cache.pop(edge_index, None)
+        try:
+            rows = [{"sequence_id": edge_index, "properties": edge_data} for edge_data, edge_index, _ in pending]
+            await self._write_single(_CYPHER_UPDATE_EDGES, rows=rows)
+            for _, edge_index, future in pending:
+                if not future.done():
+                    future.set_result(edge_index)
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Only reached with unresolved futures if the flush itself was cancelled
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(InvalidStorageError("Neo4j edge update batch was interrupted"))
 
     def _serialize_nested_collections(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Serialize nested collections to JSON strings for Neo4j storage."""
-        serialized = {}
-        for key, value in data.items():
-            if isinstance(value, (list, tuple)):
-                # Check if it's a nested collection
-                if value and isinstance(value[0], (list, tuple, dict)):
-                    serialized[key] = json.dumps(value)
-                else:
-                    serialized[key] = value
-            elif isinstance(value, dict):
-                serialized[key] = json.dumps(value)
-            else:
-                serialized[key] = value
-        return serialized
+        return {key: _serialize_value(value) for key, value in data.items()}
 
     def _deserialize_nested_collections(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Deserialize JSON strings back to nested collections."""
         deserialized = {}
         for key, value in data.items():
-            if isinstance(value, str):
+            # Only lists and dicts are serialized, so plain strings are not run through the JSON parser
+            if isinstance(value, str) and value.startswith(_JSON_CONTAINER_PREFIXES):
                 try:
                     # Try to parse as JSON
                     parsed = json.loads(value)
@@ -385,345 +1005,408 @@ class Neo4jStorage(BaseGraphStorage[GTNode, GTEdge, GTId]):
     ) -> List[TIndex]:
         """Batch insert edges for better performance."""
         edge_ids: List[TIndex] = []
-        print("Starting batch edge insertion...", edges, indices, attrs)
         if edges is not None:
-            edges_list = list(edges)
-            
-            # Batch create edges with sequence IDs
-            cypher = """
-            OPTIONAL MATCH ()-[existing_rel:RELATED]->()
-            WITH coalesce(max(existing_rel.sequence_id), -1) AS max_seq_id
-            UNWIND range(0, size($edges) - 1) AS idx
-            WITH max_seq_id, idx, $edges[idx] AS edge_data
-            MATCH (s:Entity {name: edge_data.source})
-            MATCH (t:Entity {name: edge_data.target})
-            CREATE (s)-[r:RELATED]->(t)
-            SET r += edge_data.properties,
-                r.sequence_id = max_seq_id + idx + 1
-            RETURN r.sequence_id as sequence_id
-            """
-            
-            edge_params = []
-            for edge in edges_list:
-                edge_dict = asdict(edge)
-                source = edge_dict.pop("source")
-                target = edge_dict.pop("target")
-                # Serialize nested collections
-                edge_dict = self._serialize_nested_collections(edge_dict)
-                edge_params.append({
-                    "source": source,
-                    "target": target,
-                    "properties": edge_dict
-                })
-            
-            with self._driver.session(database=self.config.database) as session:
-                result = session.run(cypher, edges=edge_params)
-                for record in result:
-                    sequence_id = record["sequence_id"]
-                    edge_ids.append(sequence_id)
-        
+            # The input is consumed in chunks, so a generator is never fully materialized
+            edges_iter = iter(edges)
+            chunk = list(islice(edges_iter, _WRITE_CHUNK_SIZE))
+            if not chunk:
+                return edge_ids
+
+            self._mark_graph_changed()
+            async with self._sequence_lock(), self._session() as session:
+                while chunk:
+                    edge_params = [
+                        {
+                            "source": edge.source,  # type: ignore
+                            "target": edge.target,  # type: ignore
+                            "properties": self._edge_properties(edge),
+                        }
+                        for edge in chunk
+                    ]
+                    result = await session.run(_CYPHER_INSERT_EDGES, edges=edge_params)
+                    async for record in result:
+                        edge_ids.append(record["sequence_id"])
+                    chunk = list(islice(edges_iter, _WRITE_CHUNK_SIZE))
+
         elif indices is not None:
-            # Create edges by node sequence IDs
-            indices_list = list(indices)
-            
-            # Convert sequence IDs to node names for the query
-            node_pairs = []
-            for src_idx, tgt_idx in indices_list:
-                src_name = await self._get_node_by_sequence_id(src_idx)
-                tgt_name = await self._get_node_by_sequence_id(tgt_idx)
-                if src_name and tgt_name:
-                    node_pairs.append({"source": src_name, "target": tgt_name})
-            
-            if node_pairs and attrs:
-                # Serialize nested collections in attrs
-                serialized_attrs = self._serialize_nested_collections(dict(attrs))
-                
-                cypher = """
-                OPTIONAL MATCH ()-[existing_rel:RELATED]->()
-                WITH coalesce(max(existing_rel.sequence_id), -1) AS max_seq_id
-                UNWIND range(0, size($indices) - 1) AS idx
-                WITH max_seq_id, idx, $indices[idx] AS node_pair
-                MATCH (s:Entity {name: node_pair.source})
-                MATCH (t:Entity {name: node_pair.target})
-                CREATE (s)-[r:RELATED]->(t)
-                SET r += $properties,
-                    r.sequence_id = max_seq_id + idx + 1
-                RETURN r.sequence_id as sequence_id
-                """
-                
-                with self._driver.session(database=self.config.database) as session:
-                    result = session.run(
-                        cypher, 
-                        indices=node_pairs, 
-                        properties=serialized_attrs
-                    )
-                    for record in result:
-                        sequence_id = record["sequence_id"]
-                        edge_ids.append(sequence_id)
-            elif node_pairs:
-                # No attributes to set, just create edges
-                cypher = """
-                OPTIONAL MATCH ()-[existing_rel:RELATED]->()
-                WITH coalesce(max(existing_rel.sequence_id), -1) AS max_seq_id
-                UNWIND range(0, size($indices) - 1) AS idx
-                WITH max_seq_id, idx, $indices[idx] AS node_pair
-                MATCH (s:Entity {name: node_pair.source})
-                MATCH (t:Entity {name: node_pair.target})
-                CREATE (s)-[r:RELATED]->(t)
-                SET r.sequence_id = max_seq_id + idx + 1
-                RETURN r.sequence_id as sequence_id
-                """
-                
-                with self._driver.session(database=self.config.database) as session:
-                    result = session.run(cypher, indices=node_pairs)
-                    for record in result:
-                        sequence_id = record["sequence_id"]
-                        edge_ids.append(sequence_id)
-        
+            # Create edges by node sequence IDs, no need to look up the node names first
+            indices_iter = iter(indices)
+            chunk = list(islice(indices_iter, _WRITE_CHUNK_SIZE))
+            if not chunk:
+                return edge_ids
+
+            self._mark_graph_changed()
+            offset = 0
+            async with self._sequence_lock(), self._session() as session:
+                while chunk:
+                    node_pairs = [[int(src_idx), int(tgt_idx)] for src_idx, tgt_idx in chunk]
+                    if attrs:
+                        # attrs holds one value per edge, in the order of the indices
+                        rows = [
+                            {
+                                "pair": node_pair,
+                                # Serialize nested collections
+                                "properties": self._serialize_nested_collections(
+                                    {key: values[offset + i] for key, values in attrs.items()}
+                                ),
+                            }
+                            for i, node_pair in enumerate(node_pairs)
+                        ]
+                        result = await session.run(_CYPHER_INSERT_EDGES_BY_INDEX_WITH_ATTRS, rows=rows)
+                    else:
+                        # No attributes to set, just create edges
+                        result = await session.run(_CYPHER_INSERT_EDGES_BY_INDEX, indices=node_pairs)
+                    async for record in result:
+                        edge_ids.append(record["sequence_id"])
+                    offset += len(chunk)
+                    chunk = list(islice(indices_iter, _WRITE_CHUNK_SIZE))
+
         return edge_ids
 
     async def are_neighbours(self, source_node: Union[GTId, TIndex], target_node: Union[GTId, TIndex]) -> bool:
         """Check if two nodes are connected."""
-        cypher = """
-        MATCH (s:Entity {name: $source})-[:RELATED]-(t:Entity {name: $target})
-        RETURN count(*) > 0 as connected
-        """
-        
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher, source=source_node, target=target_node)
-            record = result.single()
-            if record is None:
-                return False
-            return record["connected"]
+        key = (source_node, target_node)
+        if key in self._neighbours_cache:
+            self._neighbours_cache.move_to_end(key)
+            return self._neighbours_cache[key]
+
+        record = await self._read_single(_CYPHER_ARE_NEIGHBOURS, source=source_node, target=target_node)
+        connected = bool(record and record["connected"])
+
+        _lru_put(self._neighbours_cache, key, connected, _NEIGHBOURS_CACHE_SIZE)
+        return connected
+
+    async def are_neighbours_many(
+        self, pairs: Sequence[Tuple[Union[GTId, TIndex], Union[GTId, TIndex]]]
+    ) -> List[bool]:
+        """Check several node pairs with a single query, in the order of the pairs."""
+        found: Dict[Tuple[Any, Any], bool] = {}
+        missing: List[Tuple[Any, Any]] = []
+        for key in pairs:
+            key = tuple(key)  # type: ignore
+            if key in self._neighbours_cache:
+                self._neighbours_cache.move_to_end(key)
+                found[key] = self._neighbours_cache[key]
+            else:
+                missing.append(key)
+
+        if missing:
+            missing = list(dict.fromkeys(missing))
+            records = await self._run(
+                _CYPHER_ARE_NEIGHBOURS_MANY, RoutingControl.READ, pairs=[list(key) for key in missing]
+            )
+            for key, record in zip(missing, records):
+                found[key] = bool(record["connected"])
+                _lru_put(self._neighbours_cache, key, found[key], _NEIGHBOURS_CACHE_SIZE)
+
+        return [found[tuple(key)] for key in pairs]  # type: ignore
 
     async def delete_edges_by_index(self, indices: Iterable[TIndex]) -> None:
         """Delete edges by their sequence IDs."""
-        indices_list = list(indices)
-        
-        if indices_list:
-            cypher = """
-            UNWIND $sequence_ids as sequence_id
-            MATCH ()-[r:RELATED {sequence_id: sequence_id}]->()
-            DELETE r
-            """
-            
-            with self._driver.session(database=self.config.database) as session:
-                session.run(cypher, sequence_ids=indices_list)
+        indices_iter = iter(indices)
+        chunk = list(islice(indices_iter, _WRITE_CHUNK_SIZE))
+        if not chunk:
+            return
+
+        self._mark_graph_changed()
+        # Sequence IDs of deleted edges can be handed out again
+        self._edge_cache.clear()
+        async with self._session() as session:
+            while chunk:
+                result = await session.run(_CYPHER_DELETE_EDGES, sequence_ids=[int(i) for i in chunk])
+                await result.consume()
+                chunk = list(islice(indices_iter, _WRITE_CHUNK_SIZE))
+        # Deletes do not hold the sequence lock, so counts read while they ran are dropped once they are done
+        self._mark_graph_changed()
 
     async def score_nodes(self, initial_weights: Optional[csr_matrix]) -> csr_matrix:
         """Calculate PageRank scores for nodes."""
-        # Use Neo4j GDS library for PageRank algorithm
-        cypher_create_graph = """
-        CALL gds.graph.project(
-            'graphrag_graph',
-            'Entity',
-            {
-                RELATED: {
-                    orientation: 'UNDIRECTED'
-                }
-            }
-        )
-        """
-        
-        cypher_pagerank = """
-        CALL gds.pageRank.stream('graphrag_graph', {
-            dampingFactor: $damping,
-            maxIterations: 20
-        })
-        YIELD nodeId, score
-        RETURN nodeId, score
-        ORDER BY nodeId
-        """
-        
-        cypher_drop_graph = """
-        CALL gds.graph.drop('graphrag_graph') YIELD graphName
-        RETURN graphName
-        """
-        
         try:
-            with self._driver.session(database=self.config.database) as session:
-                # Create in-memory graph projection
-                session.run(cypher_create_graph)
-                
-                # Calculate PageRank
-                result = session.run(cypher_pagerank, damping=self.config.ppr_damping)
-                scores = [record["score"] for record in result]
-                print(f"PageRank scores calculated: {len(scores)} nodes", scores)
-                # Clean up
-                session.run(cypher_drop_graph)
-                
-                if not scores:
-                    return csr_matrix((1, 0))
-                
-                scores_array = np.array(scores, dtype=np.float32)
-                return csr_matrix(scores_array.reshape(1, -1))
-                
+            # Projecting copies the whole graph into GDS, so reuse the projection until any storage changes the graph
+            graph_name = f"{_GDS_GRAPH_NAME_PREFIX}_v{await self._shared_graph_version()}"
+            async with self._session() as session:
+                result = await session.run(_CYPHER_GDS_GRAPH_EXISTS, graph_name=graph_name)
+                record = await result.single()
+                if not (record and record["exists"]):
+                    try:
+                        # Create in-memory graph projection
+                        result = await session.run(_CYPHER_CREATE_GDS_GRAPH, graph_name=graph_name)
+                        await result.consume()
+                    except ClientError:
+                        # Another storage may have projected the same version concurrently
+                        result = await session.run(_CYPHER_GDS_GRAPH_EXISTS, graph_name=graph_name)
+                        record = await result.single()
+                        if not (record and record["exists"]):
+                            raise
+                    try:
+                        result = await session.run(
+                            _CYPHER_DROP_STALE_GDS_GRAPHS, prefix=_GDS_GRAPH_NAME_PREFIX, graph_name=graph_name
+                        )
+                        await result.consume()
+                    except Exception as e:
+                        logger.debug(f"Failed to drop stale GDS graph projections: {e}")
+
+                # Calculate PageRank, scattering the scores into a preallocated buffer by sequence ID
+                result = await session.run(_CYPHER_PAGERANK, graph_name=graph_name, damping=self.config.ppr_damping)
+                record = await result.single()
+                scores_array: Optional[np.ndarray] = None
+                if record is not None:
+                    scores_array = np.zeros(record["node_count"], dtype=np.float32)
+                    node_seq_ids = np.asarray(record["node_seq_ids"], dtype=np.int64)
+                    in_range = node_seq_ids < len(scores_array)
+                    scores_array[node_seq_ids[in_range]] = np.asarray(record["scores"], dtype=np.float32)[in_range]
+                logger.debug(f"PageRank scores calculated: {0 if scores_array is None else len(scores_array)} nodes")
+
+                if scores_array is None or len(scores_array) == 0:
+                    return _EMPTY_SCORES
+
+                return _scores_to_csr(scores_array)
+
         except Exception as e:
             logger.error(f"PageRank calculation failed: {e}")
             # Fallback to simple degree centrality
             return await self._fallback_node_scoring()
 
+    async def _shared_graph_version(self) -> int:
+        """Return the database-wide graph version, first bumping it if this storage changed the graph."""
+        if not self._graph_changes_unpublished:
+            record = await self._read_single(_CYPHER_GRAPH_VERSION)
+            version = record["version"] if record else 0
+            self._sync_graph_version(version)
+            return version
+        # Cleared before bumping so that writes made meanwhile are published again
+        self._graph_changes_unpublished = False
+        try:
+            record = await self._write_single(_CYPHER_BUMP_GRAPH_VERSION)
+        except Exception:
+            self._graph_changes_unpublished = True
+            raise
+        version = record["version"] if record else 0
+        self._sync_graph_version(version, bumped=True)
+        return version
+
+    async def _check_graph_version(self) -> None:
+        """Drop the cached graph state if another storage changed the graph since this one last looked."""
+        record = await self._read_single(_CYPHER_GRAPH_VERSION)
+        self._sync_graph_version(record["version"] if record else 0)
+
     async def _fallback_node_scoring(self) -> csr_matrix:
         """Fallback node scoring using degree centrality."""
-        cypher = """
-        MATCH (n:Entity)
-        OPTIONAL MATCH (n)-[:RELATED]-()
-        WITH n, count(*) as degree, n.sequence_id as node_seq_id
-        RETURN node_seq_id, degree
-        ORDER BY node_seq_id
-        """
-        
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher)
-            
-            # Create a list to store degrees by integer index
-            max_index = -1
-            degree_map = {}
-            
-            for record in result:
-                node_seq_id = record["node_seq_id"]
-                degree = record["degree"]
-                degree_map[node_seq_id] = degree
-                max_index = max(max_index, node_seq_id)
-            
-            if max_index == -1:
-                return csr_matrix((1, 0))
-            
-            # Create ordered list of degrees
-            degrees = []
-            for i in range(max_index + 1):
-                degrees.append(degree_map.get(i, 0))
-            
-            # Normalize degrees
-            max_degree = max(degrees) if degrees else 1
-            normalized_scores = [d / max_degree for d in degrees]
-            
-            scores_array = np.array(normalized_scores, dtype=np.float32)
-            return csr_matrix(scores_array.reshape(1, -1))
+        async def work(tx: AsyncManagedTransaction) -> List[List[int]]:
+            result = await tx.run(_CYPHER_DEGREES)
+            # Plain value lists instead of one Record (and key lookup) per node
+            return await result.values()
+
+        async with self._session() as session:
+            values = await session.execute_read(work)
+
+        if not values or values[0][0] == 0:
+            return _EMPTY_SCORES
+
+        # Columns are (size, node_seq_id, degree); degrees are scattered by sequence ID in one NumPy call
+        table = np.array(values, dtype=np.int64)
+        degrees = np.zeros(table[0, 0], dtype=np.float32)
+        degrees[table[:, 1]] = table[:, 2]
+
+        # Normalize degrees in place. Degrees are whole numbers, so the max is either 0 (edgeless graph,
+        # all scores stay 0) or at least 1
+        degrees /= max(degrees.max(), 1.0)
+        return _scores_to_csr(degrees)
 
     async def get_entities_to_relationships_map(self) -> csr_matrix:
         """Get entity-relationship adjacency matrix."""
-        cypher = """
-        MATCH (n:Entity)
-        WITH n, n.sequence_id as node_seq_id
-        ORDER BY node_seq_id
-        OPTIONAL MATCH (n)-[r:RELATED]-()
-        WITH n.sequence_id as node_seq_id, collect(DISTINCT r.sequence_id) as edge_seq_ids
-        RETURN node_seq_id, edge_seq_ids
-        """
-        
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cypher)
-            
-            node_edges = []
-            max_node_idx = -1
-            
-            for record in result:
-                node_seq_id = record["node_seq_id"] or 0
-                edge_seq_ids = record["edge_seq_ids"] or []
-                
-                # Ensure we have enough entries in the list
-                while len(node_edges) <= node_seq_id:
-                    node_edges.append([])
-                
-                node_edges[node_seq_id] = [eid for eid in edge_seq_ids if eid is not None]
-                max_node_idx = max(max_node_idx, node_seq_id)
-            
-            if max_node_idx == -1:
-                return csr_matrix((0, 0))
-            
-            node_count = await self.node_count()
-            edge_count = await self.edge_count()
-            
-            return csr_from_indices_list(
-                node_edges,
-                shape=(node_count, edge_count)
-            )
+        record = await self._read_single(_CYPHER_ENTITIES_TO_RELATIONSHIPS)
+        if record is None:
+            return csr_matrix((0, 0))
+
+        # scipy keeps int64 indices when given int64 arrays, int32 halves the index memory of the matrix
+        rows = np.asarray(record["node_seq_ids"], dtype=np.int32)
+        cols = np.asarray(record["edge_seq_ids"], dtype=np.int32)
+        return csr_matrix(
+            (np.ones(rows.size, dtype=np.int64), (rows, cols)),
+            shape=(record["node_count"], record["edge_count"]),
+        )
 
-    async def get_relationships_attrs(self, key: str) -> List[List[Any]]:
+    async def get_relationships_attrs(self, key: str, batch_size: int = 50_000) -> List[List[Any]]:
         """Get relationship attributes by key."""
-        # Neo4j doesn't support parameterized property names, so we need to validate the key
-        # to prevent injection attacks
-        if not key.replace('_', '').isalnum():
+        # r[$key] would read any property, so only the fields of the edge class are accepted
+        if key not in self._edge_fields:
             raise ValueError(f"Invalid property key: {key}")
-            
-        cypher = f"""
-        MATCH ()-[r:RELATED]->()
-        RETURN r.`{key}` as attr_value, r.sequence_id as edge_seq_id
-        ORDER BY r.sequence_id
-        """
-        
-        with self._driver.session(database=self.config.database) as session:
-            result = session.run(cast(LiteralString, cypher))
-            
-            # Create a map from sequence ID to attribute values
-            max_index = -1
-            attr_map = {}
-            
-            for record in result:
-                edge_seq_id = record["edge_seq_id"] or 0
-                attr_value = record["attr_value"]
-                
-                # Handle deserialization of JSON strings
-                if isinstance(attr_value, str):
-                    try:
-                        parsed = json.loads(attr_value)
-                        if isinstance(parsed, list):
-                            attr_map[edge_seq_id] = parsed
-                        else:
-                            attr_map[edge_seq_id] = [parsed] if parsed is not None else []
-                    except (json.JSONDecodeError, TypeError):
-                        attr_map[edge_seq_id] = [attr_value] if attr_value is not None else []
-                elif isinstance(attr_value, list):
-                    attr_map[edge_seq_id] = attr_value
-                else:
-                    attr_map[edge_seq_id] = [attr_value] if attr_value is not None else []
-                
-                max_index = max(max_index, edge_seq_id)
-            
-            # Create ordered list of attributes
-            attrs = []
-            for i in range(max_index + 1):
-                attrs.append(attr_map.get(i, []))
-            
-            return attrs
+        if key in self._relationships_attrs_cache:
+            return self._relationships_attrs_cache[key]
+
+        async def read_page(tx: AsyncManagedTransaction, after: int) -> List[List[Any]]:
+            result = await tx.run(_CYPHER_RELATIONSHIPS_ATTRS, key=key, after=after, batch_size=batch_size)
+            # Plain value lists instead of one Record (and key lookup) per edge
+            return await result.values("edge_seq_id", "attr_value")
+
+        record = await self._read_single(_CYPHER_RELATIONSHIPS_SIZE)
+        size = record["size"] if record else 0
+
+        # Edges are written by sequence ID into a list sized once, missing IDs keep an empty list
+        attrs: List[List[Any]] = [[] for _ in range(size)]
+        after = -1
+        async with self._session() as session:
+            while after < size - 1:
+                # Each page is its own (retryable) read transaction
+                page = await session.execute_read(read_page, after)
+                for edge_seq_id, attr_value in page:
+                    after = edge_seq_id
+                    if edge_seq_id >= len(attrs):
+                        # Edge inserted after the size was read
+                        attrs.extend([] for _ in range(edge_seq_id - len(attrs) + 1))
+
+                    # Handle deserialization of JSON strings
+                    if isinstance(attr_value, str) and attr_value.startswith(_JSON_CONTAINER_PREFIXES):
+                        try:
+                            parsed = json.loads(attr_value)
+                            if isinstance(parsed, list):
+                                attrs[edge_seq_id] = parsed
+                            else:
+                                attrs[edge_seq_id] = [parsed] if parsed is not None else []
+                        except (json.JSONDecodeError, TypeError):
+                            attrs[edge_seq_id] = [attr_value]
+                    elif isinstance(attr_value, list):
+                        attrs[edge_seq_id] = attr_value
+                    elif attr_value is not None:
+                        attrs[edge_seq_id] = [attr_value]
+                if len(page) < batch_size:
+                    break
+
+        self._relationships_attrs_cache[key] = attrs
+        return attrs
 
     async def _insert_start(self):
         """Initialize graph schema and constraints."""
+        await self._check_graph_version()
+
+        try:
+            record = await self._read_single(_CYPHER_CONSTRAINT_NAMES)
+            existing_constraints = set(record["names"]) if record else set()
+        except Exception as e:
+            logger.debug(f"Failed to list constraints: {e}")
+            existing_constraints = set()
+        schema_changed = "entity_name" not in existing_constraints
+
         constraints = [
+            # The uniqueness constraint is backed by its own index on Entity.name
             "CREATE CONSTRAINT entity_name IF NOT EXISTS FOR (n:Entity) REQUIRE n.name IS UNIQUE",
-            "CREATE INDEX entity_name_index IF NOT EXISTS FOR (n:Entity) ON (n.name)",
-            "CREATE INDEX entity_sequence_id IF NOT EXISTS FOR (n:Entity) ON (n.sequence_id)",
-            "CREATE INDEX relationship_sequence_id IF NOT EXISTS FOR ()-[r:RELATED]-() ON (r.sequence_id)"
+            # A second index on the same property only adds work to every write
+            "DROP INDEX entity_name_index IF EXISTS",
         ]
-        
-        with self._driver.session(database=self.config.database) as session:
-            for constraint in constraints:
+
+        for constraint in constraints:
+            try:
+                await self._write_single(constraint)
+            except Exception as e:
+                logger.debug(f"Constraint/index already exists or failed: {e}")
+
+        # Sequence IDs are unique, and a uniqueness constraint makes every lookup by them a unique index seek.
+        # The constraint replaces the plain index of the same property (both cannot coexist); the plain index
+        # is kept when the constraint cannot be created (duplicate IDs in old data, or relationship uniqueness
+        # constraints before Neo4j 5.7)
+        sequence_id_schema = [
+            (
+                "entity_sequence_id_unique",
+                "DROP INDEX entity_sequence_id IF EXISTS",
+                "CREATE CONSTRAINT entity_sequence_id_unique IF NOT EXISTS "
+                "FOR (n:Entity) REQUIRE n.sequence_id IS UNIQUE",
+                "CREATE INDEX entity_sequence_id IF NOT EXISTS FOR (n:Entity) ON (n.sequence_id)",
+            ),
+            (
+                "relationship_sequence_id_unique",
+                "DROP INDEX relationship_sequence_id IF EXISTS",
+                "CREATE CONSTRAINT relationship_sequence_id_unique IF NOT EXISTS "
+                "FOR ()-[r:RELATED]-() REQUIRE r.sequence_id IS UNIQUE",
+                "CREATE INDEX relationship_sequence_id IF NOT EXISTS FOR ()-[r:RELATED]-() ON (r.sequence_id)",
+            ),
+        ]
+
+        for constraint_name, drop_index, create_constraint, create_index in sequence_id_schema:
+            # The plain index is only dropped right before the constraint that replaces it is created
+            if constraint_name in existing_constraints or constraint_name in self._failed_constraints:
+                continue
+            schema_changed = True
+            try:
+                await self._write_single(drop_index)
+                await self._write_single(create_constraint)
+            except Exception as e:
+                logger.debug(f"Falling back to a plain index: {e}")
+                self._failed_constraints.add(constraint_name)
                 try:
-                    session.run(cast(LiteralString, constraint))
+                    await self._write_single(create_index)
                 except Exception as e:
                     logger.debug(f"Constraint/index already exists or failed: {e}")
 
+        # Indexes are populated in the background, queries issued before they are online scan instead
+        if schema_changed:
+            try:
+                await self._write_single("CALL db.awaitIndexes(300)")
+            except Exception as e:
+                logger.warning(f"Indexes are not online yet: {e}")
+
     async def _insert_done(self):
         """Finalize insert operations."""
-        # Could add optimizations like updating statistics
-        pass
+        # Let the other storages on this database know that their GDS projection is stale
+        if self._graph_changes_unpublished:
+            await self._shared_graph_version()
 
     async def _query_start(self):
         """Prepare for query operations."""
-        # No need to load mappings anymore - using direct database queries
-        pass
+        # Entities are read with direct database queries; only the cached graph state needs checking
+        await self._check_graph_version()
 
     async def _query_done(self):
         """Cleanup after queries."""
         pass
 
-    def close(self):
+    async def aclose(self):
         """Close Neo4j driver connection."""
-        if self._driver:
-            self._driver.close()
-            logger.info("Neo4j connection closed")
+        if self._driver is None:
+            return
+        if self._driver_loop is not asyncio.get_running_loop():
+            # The driver belongs to another loop and cannot be used from here; let that loop close it
+            self._release_driver()
+            logger.info("Neo4j connection released")
+            return
+        # The GDS projection is shared with the other storages on this database, so it is left in place;
+        # only this storage's unpublished changes are announced. The existing driver is used directly,
+        # as _session() would build a fresh one if this one was replaced
+        if self._graph_changes_unpublished:
+            try:
+                result = await self._driver.execute_query(
+                    _CYPHER_BUMP_GRAPH_VERSION, database_=self.config.database
+                )
+                self._graph_changes_unpublished = False
+                if result.records:
+                    self._sync_graph_version(result.records[0]["version"], bumped=True)
+            except Exception as e:
+                logger.debug(f"Failed to publish the graph version: {e}")
+        closer = self._driver_closer
+        self._release_driver()
+        if closer is not None:
+            # The closer task closes the driver when cancelled; wait for it to finish
+            await asyncio.gather(closer, return_exceptions=True)
+        logger.info("Neo4j connection closed")
+
+    def close(self):
+        """Close Neo4j driver connection from synchronous code.
+
+        Async callers should await aclose() or use the storage as an async context manager instead.
+        """
+        if self._driver is None:
+            return
+        loop = self._driver_loop
+        if loop is None or loop.is_closed():
+            # The pool was closed when its event loop shut down, nothing left to release
+            self._release_driver()
+        elif loop.is_running():
+            loop.create_task(self.aclose())
+        else:
+            loop.run_until_complete(self.aclose())
+
+    async def __aenter__(self):
+        return self
 
-    def __del__(self):
-        """Ensure connection is closed on garbage collection."""
-        self.close()
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any):
+        await self.aclose()
@@ -1,4 +1,3 @@
-import pickle
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Optional, Union
 
@@ -7,7 +6,7 @@ import numpy.typing as npt
 
 from fast_graphrag._exceptions import InvalidStorageError
 from fast_graphrag._types import GTKey, GTValue, TIndex
-from fast_graphrag._utils import logger
+from fast_graphrag._utils import dump_pickle, load_pickle, logger
 
 from ._base import BaseIndexedKeyValueStorage
 
@@ -80,11 +79,10 @@ class PickleIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
 
             if data_file_name:
                 try:
-                    with open(data_file_name, "rb") as f:
-                        self._data, self._free_indices, self._key_to_index = pickle.load(f)
-                        logger.debug(
-                            f"Loaded {len(self._data)} elements from indexed key-value storage '{data_file_name}'."
-                        )
+                    self._data, self._free_indices, self._key_to_index = await load_pickle(data_file_name)
+                    logger.debug(
+                        f"Loaded {len(self._data)} elements from indexed key-value storage '{data_file_name}'."
+                    )
                 except Exception as e:
                     t = f"Error loading data file for key-vector storage '{data_file_name}': {e}"
                     logger.error(t)
@@ -105,9 +103,8 @@ class PickleIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
         if self.namespace:
             data_file_name = self.namespace.get_save_path(self.RESOURCE_NAME)
             try:
-                with open(data_file_name, "wb") as f:
-                    pickle.dump((self._data, self._free_indices, self._key_to_index), f)
-                    logger.debug(f"Saving {len(self._data)} elements to indexed key-value storage '{data_file_name}'.")
+                await dump_pickle((self._data, self._free_indices, self._key_to_index), data_file_name)
+                logger.debug(f"Saving {len(self._data)} elements to indexed key-value storage '{data_file_name}'.")
             except Exception as e:
                 t = f"Error saving data file for key-vector storage '{data_file_name}': {e}"
                 logger.error(t)
@@ -118,11 +115,10 @@ class PickleIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
         data_file_name = self.namespace.get_load_path(self.RESOURCE_NAME)
         if data_file_name:
             try:
-                with open(data_file_name, "rb") as f:
-                    self._data, self._free_indices, self._key_to_index = pickle.load(f)
-                    logger.debug(
-                        f"Loaded {len(self._data)} elements from indexed key-value storage '{data_file_name}'."
-                    )
+                self._data, self._free_indices, self._key_to_index = await load_pickle(data_file_name)
+                logger.debug(
+                    f"Loaded {len(self._data)} elements from indexed key-value storage '{data_file_name}'."
+                )
             except Exception as e:
                 t = f"Error loading data file for key-vector storage {data_file_name}: {e}"
                 logger.error(t)
@@ -1,12 +1,13 @@
+import asyncio
+import gc
 import json
 import pickle
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Optional, Union, Any
 
 import numpy as np
-import numpy.typing as npt
 import redis
-from redis.connection import ConnectionPool
+from redis.connection import BlockingConnectionPool
 
 from fast_graphrag._exceptions import InvalidStorageError
 from fast_graphrag._types import GTKey, GTValue, TIndex
@@ -14,10 +15,88 @@ from fast_graphrag._utils import logger
 
 from ._base import BaseIndexedKeyValueStorage
 
+# Older layouts kept the free index list inside the metadata hash, either as raw int64 bytes
+# or as a pickled list. They are migrated to the native free index list on load.
+_FREE_INDICES_FIELD = "free_indices_i64"
+_LEGACY_FREE_INDICES_FIELD = "free_indices"
+# Keys requested per SCAN cursor step and keys sent per batched UNLINK / MEMORY USAGE pipeline.
+_SCAN_COUNT = 1000
+_KEY_BATCH_SIZE = 500
+# First characters a JSON document can start with; plain string keys outside this set skip json.loads.
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+# The upsert and delete scripts build the data keys (prefix .. index) themselves, since indices are only
+# known inside the script, so those keys are not declared in KEYS. This requires a standalone (non-cluster)
+# Redis server, where a script may touch any key.
+
+# Allocates indices and writes one upsert batch atomically in a single round trip.
+# KEYS: key-index hash, free index list, metadata hash.
+# ARGV: data key prefix, then alternating serialized key / serialized value.
+# Returns the index assigned to each key, in order.
+_UPSERT_SCRIPT = """
+local prefix = ARGV[1]
+local indices = {}
+for i = 2, #ARGV, 2 do
+    local index = redis.call('HGET', KEYS[1], ARGV[i])
+    if not index then
+        index = redis.call('RPOP', KEYS[2])
+        if not index then
+            index = redis.call('HINCRBY', KEYS[3], 'max_index', 1) - 1
+        end
+        redis.call('HSET', KEYS[1], ARGV[i], index)
+    end
+    redis.call('SET', prefix .. index, ARGV[i + 1])
+    indices[#indices + 1] = tonumber(index)
+end
+return indices
+"""
+
+# Deletes keys atomically, taking each index from the key-index hash itself so that only indices that were
+# actually released go back on the free list.
+# KEYS: key-index hash, free index list. ARGV: data key prefix, then the serialized keys.
+# Returns 1 for each key that was deleted and 0 for each key that did not exist, in order.
+_DELETE_SCRIPT = """
+local prefix = ARGV[1]
+local deleted = {}
+for i = 2, #ARGV do
+    local index = redis.call('HGET', KEYS[1], ARGV[i])
+    if index then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+        redis.call('DEL', prefix .. index)
+        redis.call('LPUSH', KEYS[2], index)
+        deleted[#deleted + 1] = 1
+    else
+        deleted[#deleted + 1] = 0
+    end
+end
+return deleted
+"""
+
+# Moves the free index list of an older layout into the native list, only if the legacy fields still hold
+# what the caller read, so that concurrent loaders never push the same indices twice. Also seeds max_index.
+# KEYS: metadata hash, free index list.
+# ARGV: the two legacy field names, the values read from them ('' when missing), the max_index to seed
+# ('' to keep the stored one), then the free indices held by the legacy values.
+# Returns 1 if the free indices were migrated by this call, 0 otherwise.
+_MIGRATE_SCRIPT = """
+if ARGV[5] ~= '' then
+    redis.call('HSETNX', KEYS[1], 'max_index', ARGV[5])
+end
+local current = redis.call('HMGET', KEYS[1], ARGV[1], ARGV[2])
+if (current[1] or '') ~= ARGV[3] or (current[2] or '') ~= ARGV[4] then
+    return 0
+end
+for i = 6, #ARGV do
+    redis.call('RPUSH', KEYS[2], ARGV[i])
+end
+redis.call('HDEL', KEYS[1], ARGV[1], ARGV[2])
+return 1
+"""
+
 
 @dataclass
 class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
-    """Redis-based implementation of indexed key-value storage for fast-graphrag"""
+    """Redis-based implementation of indexed key-value storage for fast-graphrag (standalone Redis only)"""
     
     # Redis connection parameters
     redis_host: str = field(default="localhost")
@@ -25,30 +104,47 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
     redis_db: int = field(default=0)
     redis_password: Optional[str] = field(default=None)
     redis_prefix: str = field(default="graphrag")
+    redis_max_connections: int = field(default=4)
     
     # Internal fields
     _redis_client: Optional[redis.Redis] = field(init=False, default=None)
-    _connection_pool: Optional[ConnectionPool] = field(init=False, default=None)
+    _connection_pool: Optional[BlockingConnectionPool] = field(init=False, default=None)
     _key_to_index: Dict[GTKey, TIndex] = field(init=False, default_factory=dict)
-    _free_indices: List[TIndex] = field(init=False, default_factory=list)
-    _np_keys: Optional[npt.NDArray[np.object_]] = field(init=False, default=None)
-    _max_index: int = field(init=False, default=0)
+    _upsert_script: Any = field(init=False, default=None)
+    _delete_script: Any = field(init=False, default=None)
+    _migrate_script: Any = field(init=False, default=None)
+    _loaded: bool = field(init=False, default=False)
+    _data_key_prefix: str = field(init=False, default="")
+    _metadata_key: str = field(init=False, default="")
+    _free_indices_key: str = field(init=False, default="")
+    _key_index_key: str = field(init=False, default="")
 
     def __post_init__(self):
         """Initialize Redis connection after dataclass initialization"""
+        self._refresh_key_names()
         self._initialize_redis()
 
+    def _refresh_key_names(self):
+        """Precompute the Redis key names for the current namespace"""
+        namespace_key = self.namespace.namespace if self.namespace else "default"
+        self._data_key_prefix = f"{self.redis_prefix}:data:{namespace_key}:"
+        self._metadata_key = f"{self.redis_prefix}:meta:{namespace_key}"
+        self._free_indices_key = f"{self.redis_prefix}:free:{namespace_key}"
+        self._key_index_key = f"{self.redis_prefix}:key_index:{namespace_key}"
+
     def _initialize_redis(self):
         """Initialize Redis connection pool and client"""
         try:
-            # Create connection pool for better performance
-            self._connection_pool = ConnectionPool(
+            # Every command and pipeline checks a connection out of this pool for its duration, so the
+            # asyncio.to_thread workers never share a socket. Requests are batched (MGET/HMGET/pipelines/
+            # Lua), so a few connections suffice; a blocking pool makes extra workers wait instead of failing
+            self._connection_pool = BlockingConnectionPool(
                 host=self.redis_host,
                 port=self.redis_port,
                 db=self.redis_db,
                 password=self.redis_password,
                 decode_responses=False,  # We'll handle encoding ourselves
-                max_connections=10
+                max_connections=self.redis_max_connections,
             )
             
             # Create Redis client
@@ -56,6 +152,9 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
             
             # Test connection
             self._redis_client.ping()
+            self._upsert_script = self._redis_client.register_script(_UPSERT_SCRIPT)
+            self._delete_script = self._redis_client.register_script(_DELETE_SCRIPT)
+            self._migrate_script = self._redis_client.register_script(_MIGRATE_SCRIPT)
             logger.info(f"Connected to Redis at {self.redis_host}:{self.redis_port}")
             
         except Exception as e:
@@ -64,23 +163,24 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
 
     def _get_data_key(self, index: TIndex) -> str:
         """Generate Redis key for data storage"""
-        namespace_key = self.namespace.namespace if self.namespace else "default"
-        return f"{self.redis_prefix}:data:{namespace_key}:{index}"
+        return self._data_key_prefix + str(index)
 
     def _get_metadata_key(self) -> str:
         """Generate Redis key for metadata storage"""
-        namespace_key = self.namespace.namespace if self.namespace else "default"
-        return f"{self.redis_prefix}:meta:{namespace_key}"
+        return self._metadata_key
+
+    def _get_free_indices_key(self) -> str:
+        """Generate Redis key for the list of reusable indices"""
+        return self._free_indices_key
 
     def _get_key_index_key(self) -> str:
         """Generate Redis key for key-to-index mapping"""
-        namespace_key = self.namespace.namespace if self.namespace else "default"
-        return f"{self.redis_prefix}:key_index:{namespace_key}"
+        return self._key_index_key
 
     def _serialize_value(self, value: GTValue) -> bytes:
         """Serialize value for Redis storage"""
         try:
-            return pickle.dumps(value)
+            return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
         except Exception as e:
             logger.error(f"Failed to serialize value: {e}")
             raise InvalidStorageError(f"Serialization failed: {e}")
@@ -101,6 +201,8 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
 
     def _deserialize_key(self, key_str: str) -> GTKey:
         """Deserialize key from Redis hash field"""
+        if not key_str or key_str[0] not in _JSON_START_CHARS:
+            return key_str
         try:
             return json.loads(key_str)
         except (json.JSONDecodeError, TypeError):
@@ -110,120 +212,88 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
         """Get the number of stored items"""
         try:
             key_index_key = self._get_key_index_key()
-            return self._redis_client.hlen(key_index_key)
+            return await asyncio.to_thread(self._redis_client.hlen, key_index_key)
         except Exception as e:
             logger.error(f"Failed to get size: {e}")
             return 0
 
     async def get(self, keys: Iterable[GTKey]) -> Iterable[Optional[GTValue]]:
         """Get values by keys"""
-        results = []
+        keys = list(keys)
         try:
             # Get indices for keys
             indices = await self.get_index(keys)
-            
-            # Get values by indices
-            for index in indices:
-                if index is not None:
-                    data_key = self._get_data_key(index)
-                    data = self._redis_client.get(data_key)
-                    if data:
-                        results.append(self._deserialize_value(data))
-                    else:
-                        results.append(None)
-                else:
-                    results.append(None)
-            
+            return await self.get_by_index(indices)
         except Exception as e:
             logger.error(f"Failed to get values: {e}")
-            results = [None] * len(list(keys))
-        
-        return results
+            return [None] * len(keys)
 
     async def get_by_index(self, indices: Iterable[TIndex]) -> Iterable[Optional[GTValue]]:
         """Get values by indices"""
-        results = []
+        indices = list(indices)
+        results: List[Optional[GTValue]] = [None] * len(indices)
         try:
-            print(f"get_by_index:indices:", indices)
-            for index in indices:
-                data_key = self._get_data_key(index)
-                data = self._redis_client.get(data_key)
-                print(f"get_by_index:data_key:{data_key}, data:", data)
-                if data:
-                    results.append(self._deserialize_value(data))
-                else:
-                    results.append(None)
+            # Fetch all values in a single MGET, skipping missing indices
+            positions = [i for i, index in enumerate(indices) if index is not None]
+            if positions:
+                data_keys = [self._get_data_key(indices[i]) for i in positions]
+                raw = await asyncio.to_thread(self._redis_client.mget, data_keys)
+                for i, data in zip(positions, raw):
+                    if data:
+                        results[i] = self._deserialize_value(data)
         except Exception as e:
             logger.error(f"Failed to get values by index: {e}")
-            results = [None] * len(list(indices))
+            results = [None] * len(indices)
         
         return results
 
     async def get_index(self, keys: Iterable[GTKey]) -> Iterable[Optional[TIndex]]:
         """Get indices for keys"""
-        results = []
+        keys = list(keys)
+        if not keys:
+            return []
         try:
             key_index_key = self._get_key_index_key()
             
-            for key in keys:
-                serialized_key = self._serialize_key(key)
-                index_data = self._redis_client.hget(key_index_key, serialized_key)
-                if index_data:
-                    results.append(TIndex(int(index_data)))
-                else:
-                    results.append(None)
+            serialized = [self._serialize_key(key) for key in keys]
+            raw = await asyncio.to_thread(self._redis_client.hmget, key_index_key, serialized)
+            return [TIndex(int(index_data)) if index_data is not None else None for index_data in raw]
         except Exception as e:
             logger.error(f"Failed to get indices: {e}")
-            results = [None] * len(list(keys))
-        
-        return results
+            return [None] * len(keys)
 
     async def upsert(self, keys: Iterable[GTKey], values: Iterable[GTValue]) -> None:
         """Insert or update key-value pairs"""
         try:
-            key_index_key = self._get_key_index_key()
-            metadata_key = self._get_metadata_key()
-            
             # Load metadata
             await self._load_metadata()
-            
-            pipe = self._redis_client.pipeline()
-            
-            for key, value in zip(keys, values):
-                serialized_key = self._serialize_key(key)
-                
-                # Check if key already exists
-                existing_index = self._key_to_index.get(key)
-                
-                if existing_index is None:
-                    # Assign new index
-                    if self._free_indices:
-                        index = self._free_indices.pop()
-                    else:
-                        index = TIndex(self._max_index)
-                        self._max_index += 1
-                    
-                    self._key_to_index[key] = index
-                    
-                    # Update key-to-index mapping in Redis
-                    pipe.hset(key_index_key, serialized_key, str(index))
-                    
-                    # Invalidate cache
-                    self._np_keys = None
-                else:
-                    index = existing_index
-                
-                # Store value
-                data_key = self._get_data_key(index)
-                serialized_value = self._serialize_value(value)
-                pipe.set(data_key, serialized_value)
-            
-            # Save metadata
-            pipe.hset(metadata_key, "max_index", str(self._max_index))
-            pipe.hset(metadata_key, "free_indices", pickle.dumps(self._free_indices))
-            
-            # Execute pipeline
-            pipe.execute()
+            if not self._loaded:
+                # Indices must not be allocated before the metadata of older layouts has been migrated
+                raise InvalidStorageError("Redis storage metadata could not be loaded")
+            
+            keys = list(keys)
+            args: List[Union[str, bytes]] = [self._data_key_prefix]
+            # Pickling a batch allocates many short-lived objects; keep the cyclic GC from traversing
+            # them, toggling it once for the whole batch rather than once per value
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                for key, value in zip(keys, values):
+                    args.append(self._serialize_key(key))
+                    args.append(self._serialize_value(value))
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            if len(args) == 1:
+                return
+            
+            # Index allocation and all writes happen atomically inside Redis
+            indices = await asyncio.to_thread(
+                self._upsert_script,
+                keys=[self._get_key_index_key(), self._get_free_indices_key(), self._get_metadata_key()],
+                args=args,
+            )
+            self._key_to_index.update(zip(keys, (TIndex(index) for index in indices)))
             
         except Exception as e:
             logger.error(f"Failed to upsert: {e}")
@@ -232,43 +302,25 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
     async def delete(self, keys: Iterable[GTKey]) -> None:
         """Delete keys and their values"""
         try:
-            key_index_key = self._get_key_index_key()
-            metadata_key = self._get_metadata_key()
-            
             # Load metadata
             await self._load_metadata()
             
-            pipe = self._redis_client.pipeline()
-            
-            for key in keys:
-                serialized_key = self._serialize_key(key)
-                
-                # Get index for key
-                index = self._key_to_index.get(key)
-                if index is not None:
-                    # Remove from key-to-index mapping
-                    pipe.hdel(key_index_key, serialized_key)
-                    
-                    # Delete data
-                    data_key = self._get_data_key(index)
-                    pipe.delete(data_key)
-                    
-                    # Add index to free list
-                    self._free_indices.append(index)
-                    
-                    # Remove from local cache
-                    del self._key_to_index[key]
-                    
-                    # Invalidate cache
-                    self._np_keys = None
-                else:
-                    logger.warning(f"Key '{key}' not found in indexed key-value storage.")
+            keys = list(keys)
+            if not keys:
+                return
             
-            # Save updated metadata
-            pipe.hset(metadata_key, "free_indices", pickle.dumps(self._free_indices))
+            # Redis, not the local map, decides which index each key holds; the local map may be stale
+            deleted = await asyncio.to_thread(
+                self._delete_script,
+                keys=[self._get_key_index_key(), self._get_free_indices_key()],
+                args=[self._data_key_prefix, *(self._serialize_key(key) for key in keys)],
+            )
             
-            # Execute pipeline
-            pipe.execute()
+            for key, was_deleted in zip(keys, deleted):
+                # Remove from local cache
+                self._key_to_index.pop(key, None)
+                if not was_deleted:
+                    logger.warning(f"Key '{key}' not found in indexed key-value storage.")
             
         except Exception as e:
             logger.error(f"Failed to delete: {e}")
@@ -282,91 +334,92 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
             return np.array([], dtype=bool)
 
         try:
-            # Load current keys if not cached
-            if self._np_keys is None:
-                await self._load_metadata()
-                if self._key_to_index:
-                    self._np_keys = np.fromiter(
-                        self._key_to_index.keys(),
-                        count=len(self._key_to_index),
-                        dtype=type(keys[0]) if keys else object,
-                    )
-                else:
-                    self._np_keys = np.array([], dtype=object)
-            
-            if len(self._np_keys) == 0:
-                return np.ones(len(keys), dtype=bool)
+            await self._load_metadata()
             
-            keys_array = np.array(keys, dtype=type(keys[0]))
-            return ~np.isin(keys_array, self._np_keys)
+            # Hash lookups are O(1) per key, unlike np.isin on object arrays
+            key_to_index = self._key_to_index
+            return np.fromiter((key not in key_to_index for key in keys), dtype=bool, count=len(keys))
             
         except Exception as e:
             logger.error(f"Failed to create new mask: {e}")
             return np.ones(len(keys), dtype=bool)
 
+    def invalidate(self):
+        """Drop the in-memory key-to-index map so the next access reloads it from Redis"""
+        self._loaded = False
+
     async def _load_metadata(self):
-        """Load metadata from Redis"""
+        """Load metadata from Redis, unless the in-memory copy is already authoritative"""
+        if self._loaded:
+            return
         try:
             key_index_key = self._get_key_index_key()
             metadata_key = self._get_metadata_key()
+            free_indices_key = self._get_free_indices_key()
+            
+            # Fetch the key-to-index mapping and metadata in one round trip, off the event loop
+            pipe = self._redis_client.pipeline(transaction=False)
+            pipe.hgetall(key_index_key)
+            pipe.hmget(metadata_key, ["max_index", _FREE_INDICES_FIELD, _LEGACY_FREE_INDICES_FIELD])
+            key_index_data, (max_index_data, free_indices_data, legacy_free_indices_data) = (
+                await asyncio.to_thread(pipe.execute)
+            )
+            if self._loaded:
+                # A concurrent caller finished loading first and may have mutated the map since
+                return
             
             # Load key-to-index mapping
-            key_index_data = self._redis_client.hgetall(key_index_key)
-            self._key_to_index = {}
+            key_to_index: Dict[GTKey, TIndex] = {}
             for key_str, index_str in key_index_data.items():
                 key = self._deserialize_key(key_str.decode())
-                self._key_to_index[key] = TIndex(int(index_str))
-            
-            # Load metadata
-            max_index_data = self._redis_client.hget(metadata_key, "max_index")
-            if max_index_data:
-                self._max_index = int(max_index_data)
-            else:
-                self._max_index = len(self._key_to_index)
-            
-            free_indices_data = self._redis_client.hget(metadata_key, "free_indices")
-            if free_indices_data:
-                self._free_indices = pickle.loads(free_indices_data)
-            else:
-                self._free_indices = []
-            
-            logger.debug(f"Loaded {len(self._key_to_index)} keys from Redis storage")
-            
+                key_to_index[key] = TIndex(int(index_str))
+            # Kept even if the migration below fails, the map itself is valid
+            self._key_to_index = key_to_index
         except Exception as e:
             logger.error(f"Failed to load metadata: {e}")
-            self._key_to_index = {}
-            self._free_indices = []
-            self._max_index = 0
-
-    async def _save_metadata(self):
-        """Save metadata to Redis"""
+            return
+        
         try:
-            metadata_key = self._get_metadata_key()
-            
-            pipe = self._redis_client.pipeline()
-            pipe.hset(metadata_key, "max_index", str(self._max_index))
-            pipe.hset(metadata_key, "free_indices", pickle.dumps(self._free_indices))
-            pipe.execute()
-            
-            logger.debug(f"Saved metadata to Redis storage")
-            
+            # Migrate metadata written by older layouts, atomically so that concurrent loaders cannot both do it
+            seed_max_index = max_index_data is None and bool(key_to_index)
+            if seed_max_index or free_indices_data is not None or legacy_free_indices_data is not None:
+                if free_indices_data is not None:
+                    free_indices = np.frombuffer(free_indices_data, dtype="<i8").tolist()
+                elif legacy_free_indices_data:
+                    free_indices = pickle.loads(legacy_free_indices_data)
+                else:
+                    free_indices = []
+                await asyncio.to_thread(
+                    self._migrate_script,
+                    keys=[metadata_key, free_indices_key],
+                    args=[
+                        _FREE_INDICES_FIELD,
+                        _LEGACY_FREE_INDICES_FIELD,
+                        free_indices_data or b"",
+                        legacy_free_indices_data or b"",
+                        max(key_to_index.values()) + 1 if seed_max_index else "",
+                        *free_indices,
+                    ],
+                )
         except Exception as e:
-            logger.error(f"Failed to save metadata: {e}")
-            raise InvalidStorageError(f"Metadata save failed: {e}")
+            # Left unloaded so that the next access retries; upserts refuse to allocate indices meanwhile
+            logger.error(f"Failed to migrate metadata: {e}")
+            return
+        
+        self._loaded = True
+        logger.debug(f"Loaded {len(self._key_to_index)} keys from Redis storage")
 
     async def _insert_start(self):
         """Prepare storage for insertion"""
         await self._load_metadata()
-        self._np_keys = None
 
     async def _insert_done(self):
         """Finalize insertion"""
-        await self._save_metadata()
+        pass
 
     async def _query_start(self):
         """Prepare storage for querying"""
         await self._load_metadata()
-        self._np_keys = None
 
     async def _query_done(self):
         """Finalize querying"""
@@ -389,19 +442,28 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
             namespace_key = self.namespace.namespace if self.namespace else "default"
             pattern = f"{self.redis_prefix}:*:{namespace_key}*"
             
-            # Find all keys matching the pattern
-            keys = self._redis_client.keys(pattern)
-            
-            if keys:
-                # Delete all keys
-                self._redis_client.delete(*keys)
-                logger.info(f"Cleared {len(keys)} keys from namespace {namespace_key}")
+            # Walk the matching keys with SCAN and drop them in batched, non-blocking UNLINKs
+            pipe = self._redis_client.pipeline(transaction=False)
+            batch: List[bytes] = []
+            cleared = 0
+            for key in self._redis_client.scan_iter(match=pattern, count=_SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= _KEY_BATCH_SIZE:
+                    pipe.unlink(*batch)
+                    pipe.execute()
+                    cleared += len(batch)
+                    batch.clear()
+            if batch:
+                pipe.unlink(*batch)
+                pipe.execute()
+                cleared += len(batch)
+            
+            if cleared:
+                logger.info(f"Cleared {cleared} keys from namespace {namespace_key}")
             
             # Clear local cache
             self._key_to_index = {}
-            self._free_indices = []
-            self._max_index = 0
-            self._np_keys = None
+            self._loaded = False
             
         except Exception as e:
             logger.error(f"Failed to clear namespace: {e}")
@@ -413,13 +475,30 @@ class RedisIndexedKeyValueStorage(BaseIndexedKeyValueStorage[GTKey, GTValue]):
             namespace_key = self.namespace.namespace if self.namespace else "default"
             pattern = f"{self.redis_prefix}:*:{namespace_key}*"
             
-            keys = self._redis_client.keys(pattern)
-            memory_usage = sum(self._redis_client.memory_usage(key) or 0 for key in keys)
+            total_keys = 0
+            data_keys = 0
+            metadata_keys = 0
+            memory_usage = 0
+            pipe = self._redis_client.pipeline(transaction=False)
+            batch_size = 0
+            for key in self._redis_client.scan_iter(match=pattern, count=_SCAN_COUNT):
+                total_keys += 1
+                if b":data:" in key:
+                    data_keys += 1
+                elif b":meta:" in key or b":key_index:" in key or b":free:" in key:
+                    metadata_keys += 1
+                pipe.memory_usage(key)
+                batch_size += 1
+                if batch_size >= _KEY_BATCH_SIZE:
+                    memory_usage += sum(usage or 0 for usage in pipe.execute())
+                    batch_size = 0
+            if batch_size:
+                memory_usage += sum(usage or 0 for usage in pipe.execute())
             
             return {
-                "total_keys": len(keys),
-                "data_keys": len([k for k in keys if b":data:" in k]),
-                "metadata_keys": len([k for k in keys if b":meta:" in k or b":key_index:" in k]),
+                "total_keys": total_keys,
+                "data_keys": data_keys,
+                "metadata_keys": metadata_keys,
                 "memory_usage_bytes": memory_usage,
                 "namespace": namespace_key,
                 "redis_info": {
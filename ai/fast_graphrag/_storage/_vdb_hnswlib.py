@@ -46,7 +46,11 @@ class HNSWVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
         metadata: Union[Iterable[Dict[str, Any]], None] = None,
     ) -> None:
         ids = list(ids)
-        embeddings = np.array(list(embeddings), dtype=np.float32)
+        # Avoid re-materializing (and copying) embeddings that already come as a float32 matrix
+        if isinstance(embeddings, np.ndarray):
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        else:
+            embeddings = np.array(list(embeddings), dtype=np.float32)
         metadata = list(metadata) if metadata else None
 
         assert (len(ids) == len(embeddings)) and (
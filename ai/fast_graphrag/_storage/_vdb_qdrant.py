@@ -1,8 +1,10 @@
+import asyncio
 import json
 import uuid
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+import grpc
 import numpy as np
 import numpy.typing as npt
 from scipy.sparse import csr_matrix
@@ -16,6 +18,20 @@ from fast_graphrag._utils import logger
 
 from ._base import BaseVectorStorage
 
+# Errors raised by the REST and gRPC transports of the Qdrant client respectively
+_QDRANT_ERRORS = (UnexpectedResponse, grpc.RpcError)
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Whether a Qdrant client error means the collection (or point) does not exist, for either transport."""
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 404
+    if isinstance(error, grpc.RpcError):
+        # Raised RpcErrors are grpc.Call instances carrying a status code; bare ones have none
+        code = getattr(error, "code", None)
+        return callable(code) and code() == grpc.StatusCode.NOT_FOUND
+    return False
+
 
 @dataclass
 class QdrantVectorStorageConfig:
@@ -24,8 +40,9 @@ class QdrantVectorStorageConfig:
     # Connection settings
     host: str = field(default="localhost")
     port: int = field(default=6333)
-    grpc_port: Optional[int] = field(default=None)
-    prefer_grpc: bool = field(default=False)
+    grpc_port: int = field(default=6334)
+    # gRPC avoids the JSON encode/decode overhead of the REST API; set to False to force REST (e.g. for debugging)
+    prefer_grpc: bool = field(default=True)
     https: bool = field(default=False)
     api_key: Optional[str] = field(default=None)
     prefix: Optional[str] = field(default=None)
@@ -34,13 +51,43 @@ class QdrantVectorStorageConfig:
     # Collection settings
     collection_name: str = field(default="embeddings")
     vector_size: Optional[int] = field(default=None)  # Will be set automatically
-    distance: qdrant_models.Distance = field(default=qdrant_models.Distance.COSINE)
+    # With DOT, embeddings and queries are L2-normalized by the storage, so scores equal cosine similarity
+    # without the per-candidate norm computation that COSINE does on the server.
+    distance: qdrant_models.Distance = field(default=qdrant_models.Distance.DOT)
     
     # Performance settings
     hnsw_config: Optional[qdrant_models.HnswConfigDiff] = field(default=None)
     optimizers_config: Optional[qdrant_models.OptimizersConfigDiff] = field(default=None)
-    wal_config: Optional[qdrant_models.WalConfigDiff] = field(default=None)
-    quantization_config: Optional[qdrant_models.QuantizationConfig] = field(default=None)
+    # A larger WAL segment than the 32MB default means fewer segment rollovers during large loads
+    wal_config: Optional[qdrant_models.WalConfigDiff] = field(
+        default_factory=lambda: qdrant_models.WalConfigDiff(wal_capacity_mb=128)
+    )
+    # int8 scalar quantization cuts the bytes scanned per candidate by 4x; searches rescore the
+    # top `limit * quantization_oversampling` candidates with the original vectors to preserve recall.
+    quantization_config: Optional[qdrant_models.QuantizationConfig] = field(
+        default_factory=lambda: qdrant_models.ScalarQuantization(
+            scalar=qdrant_models.ScalarQuantizationConfig(
+                type=qdrant_models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            )
+        )
+    )
+    quantization_oversampling: float = field(default=2.0)
+
+    # Upload settings
+    # Points are sent in batches of `upload_batch_size`, with at most `upload_parallel` requests in flight.
+    # Throughput peaks around 32 points per batch and 2 concurrent requests; larger values mostly add contention.
+    upload_batch_size: int = field(default=32)
+    upload_parallel: int = field(default=2)
+    # Bulk mode disables HNSW indexing between insert_start and insert_done so the index is built
+    # in a single optimizer pass at the end of the load instead of being updated on every batch,
+    # and loads points through `upload_collection`, which takes the embedding matrix directly.
+    bulk_mode: bool = field(default=False)
+    indexing_threshold: int = field(default=20000)  # Restored when bulk mode ends
+    # Batches are sent with wait=False and a single acknowledged write fences them before the next read
+    # and at insert_done; set to True to wait for every batch to be applied (strict durability).
+    durable_insert: bool = field(default=False)
     
     # Search settings
     search_params: Optional[qdrant_models.SearchParams] = field(default=None)
@@ -57,6 +104,9 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
     _client: Optional[QdrantClient] = field(init=False, default=None)
     _collection_name: str = field(init=False, default="")
     _size_cache: int = field(init=False, default=0)
+    _search_params: Optional[qdrant_models.SearchParams] = field(init=False, default=None)
+    _pending_write: Optional[qdrant_models.PointStruct] = field(init=False, default=None)
+    _search_templates: Dict[int, Dict[str, Any]] = field(init=False, default_factory=dict)
     
     def __post_init__(self):
         """Initialize the collection name with namespace and set embedding dimension."""
@@ -69,6 +119,22 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
         if self.embedding_dim == 0 and self.config.vector_size:
             self.embedding_dim = self.config.vector_size
 
+        # Rescore quantized results with the original vectors unless configured otherwise
+        self._search_params = self.config.search_params
+        if self.config.quantization_config is not None and (
+            self._search_params is None or self._search_params.quantization is None
+        ):
+            base_params = self._search_params or qdrant_models.SearchParams()
+            self._search_params = qdrant_models.SearchParams(
+                hnsw_ef=base_params.hnsw_ef,
+                exact=base_params.exact,
+                indexed_only=base_params.indexed_only,
+                quantization=qdrant_models.QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=self.config.quantization_oversampling,
+                ),
+            )
+
     @property
     def size(self) -> int:
         """Get the current number of vectors in the collection."""
@@ -80,8 +146,8 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
             current_size = collection_info.points_count or 0
             self._size_cache = current_size
             return current_size
-        except UnexpectedResponse as e:
-            if e.status_code == 404:
+        except _QDRANT_ERRORS as e:
+            if _is_not_found(e):
                 # Collection doesn't exist yet
                 return 0
             logger.warning(f"Failed to get collection size: {e}")
@@ -145,8 +211,8 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
             else:
                 # No sample to validate, assume collection is compatible
                 return
-        except UnexpectedResponse as e:
-            if e.status_code == 404:
+        except _QDRANT_ERRORS as e:
+            if _is_not_found(e):
                 # Collection doesn't exist, create it
                 pass
             else:
@@ -208,21 +274,34 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
         # you might need to implement proper conversion logic here.
         return qdrant_id  # type: ignore
 
-    def _validate_embedding_dimensions(self, embeddings: Iterable[GTEmbedding]) -> List[GTEmbedding]:
-        """Validate and normalize embedding dimensions."""
-        embeddings_list = [np.array(emb, dtype=np.float32) for emb in embeddings]
-        
-        if not embeddings_list:
-            return embeddings_list
-        
-        # Check consistency within the batch
-        first_dim = len(embeddings_list[0])
-        for i, emb in enumerate(embeddings_list):
-            if len(emb) != first_dim:
-                raise ValueError(
-                    f"Embedding dimension inconsistency in batch: "
-                    f"embedding {i} has dimension {len(emb)}, expected {first_dim}"
-                )
+    def _validate_embedding_dimensions(
+        self, embeddings: Union[npt.NDArray[np.float32], Iterable[GTEmbedding]]
+    ) -> npt.NDArray[np.float32]:
+        """Validate embedding dimensions and return them as a single (N, D) float32 array."""
+        if isinstance(embeddings, np.ndarray):
+            # A 2-D array already has consistent dimensions, only the dtype may need converting
+            embeddings_array = np.asarray(embeddings, dtype=np.float32)
+            if embeddings_array.size == 0:
+                return embeddings_array.reshape(0, 0)
+        else:
+            embeddings_list = [np.asarray(emb, dtype=np.float32) for emb in embeddings]
+
+            if not embeddings_list:
+                return np.empty((0, 0), dtype=np.float32)
+
+            # Check consistency within the batch
+            first_dim = len(embeddings_list[0])
+            for i, emb in enumerate(embeddings_list):
+                if len(emb) != first_dim:
+                    raise ValueError(
+                        f"Embedding dimension inconsistency in batch: "
+                        f"embedding {i} has dimension {len(emb)}, expected {first_dim}"
+                    )
+            embeddings_array = np.stack(embeddings_list)
+
+        if embeddings_array.ndim != 2:
+            raise ValueError(f"Embeddings must be a 2-D array, got shape {embeddings_array.shape}")
+        first_dim = embeddings_array.shape[1]
         
         # Check against collection if it exists
         if self._client:
@@ -235,26 +314,36 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
                         f"embeddings have dimension {first_dim}, collection expects {expected_dim}. "
                         f"Consider recreating the collection or using compatible embeddings."
                     )
-            except UnexpectedResponse as e:
-                if e.status_code != 404:  # Collection exists but other error
+            except _QDRANT_ERRORS as e:
+                if not _is_not_found(e):  # Collection exists but other error
                     logger.warning(f"Failed to validate against existing collection: {e}")
         
-        return embeddings_list
+        return embeddings_array
+
+    def _normalize(self, embeddings_array: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+        """L2-normalize embeddings when the collection scores with a dot product."""
+        if self.config.distance != qdrant_models.Distance.DOT or embeddings_array.size == 0:
+            return embeddings_array
+        norms = np.linalg.norm(embeddings_array, axis=1, keepdims=True)
+        return np.divide(embeddings_array, norms, out=np.zeros_like(embeddings_array), where=norms > 0)
 
     async def upsert(
         self,
         ids: Iterable[GTId],
-        embeddings: Iterable[GTEmbedding],
+        embeddings: Union[npt.NDArray[np.float32], Iterable[GTEmbedding]],
         metadata: Union[Iterable[Dict[str, Any]], None] = None,
     ) -> None:
-        """Insert or update vectors in Qdrant."""
+        """Insert or update vectors in Qdrant.
+
+        Embeddings can be passed as a (N, D) array, which avoids converting them one by one.
+        """
         ids_list = list(ids)
         # Validate embeddings first
-        embeddings_list = self._validate_embedding_dimensions(embeddings)
+        embeddings_array = self._normalize(self._validate_embedding_dimensions(embeddings))
         metadata_list = list(metadata) if metadata else None
 
         # Validate input lengths
-        if not (len(ids_list) == len(embeddings_list)):
+        if not (len(ids_list) == len(embeddings_array)):
             raise ValueError("ids and embeddings must have the same length")
         
         if metadata_list is not None and len(metadata_list) != len(ids_list):
@@ -264,40 +353,53 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
             return  # Nothing to upsert
 
         # Ensure collection exists with dimension validation
-        if embeddings_list:
-            await self.ensure_dimension_compatibility(embeddings_list[0])
+        if len(embeddings_array):
+            await self.ensure_dimension_compatibility(embeddings_array[0])
         else:
             self._ensure_collection_exists()
         
         client = self._get_client()
         
         logger.debug(f"Upserting {len(ids_list)} vectors to collection '{self._collection_name}'")
-        # Prepare points for upsert
-        points = []
-        for i, (gt_id, embedding) in enumerate(zip(ids_list, embeddings_list)):
-            qdrant_id = self._convert_id(gt_id)
-            payload = {}
-            
+        qdrant_ids = self._convert_ids(ids_list)
+        payloads = []
+        for i, gt_id in enumerate(ids_list):
             # Add original ID to payload for reverse lookup
-            payload["original_id"] = str(gt_id)
+            payload = {"original_id": str(gt_id)}
             
             # Add metadata if provided
-            if metadata_list and i < len(metadata_list) and metadata_list[i]:
+            if metadata_list and metadata_list[i]:
                 payload.update(metadata_list[i])
-            
-            point = qdrant_models.PointStruct(
-                id=qdrant_id,
-                vector=embedding.tolist(),
-                payload=payload,
-            )
-            points.append(point)
+            payloads.append(payload)
+
+        if self.config.bulk_mode:
+            await self._upload_collection(qdrant_ids, embeddings_array, payloads)
+            return
+
+        # Prepare points for upsert, converting all vectors to Python lists in a single pass
+        points = [
+            qdrant_models.PointStruct(id=qdrant_id, vector=vector, payload=payload)
+            for qdrant_id, vector, payload in zip(qdrant_ids, embeddings_array.tolist(), payloads)
+        ]
 
         try:
-            # Upsert points in batches to avoid memory issues
-            batch_size = 100
-            for i in range(0, len(points), batch_size):
-                batch = points[i:i + batch_size]
-                client.upsert(collection_name=self._collection_name, points=batch)
+            # Upsert points in batches, keeping a bounded number of requests in flight
+            batch_size = max(1, self.config.upload_batch_size)
+            semaphore = asyncio.Semaphore(max(1, self.config.upload_parallel))
+
+            wait = self.config.durable_insert
+
+            async def _upsert_batch(batch: List[qdrant_models.PointStruct]) -> None:
+                async with semaphore:
+                    await asyncio.to_thread(
+                        client.upsert, collection_name=self._collection_name, points=batch, wait=wait
+                    )
+
+            await asyncio.gather(
+                *(_upsert_batch(points[i:i + batch_size]) for i in range(0, len(points), batch_size))
+            )
+            if not wait:
+                self._pending_write = points[-1]
             
             self._size_cache += len(points)
             logger.debug(f"Upserted {len(points)} points to collection '{self._collection_name}'")
@@ -309,39 +411,112 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
             logger.error(f"Collection debug info: {debug_info}")
             raise InvalidStorageError(f"Failed to upsert vectors: {e}") from e
 
+    async def _upload_collection(
+        self,
+        qdrant_ids: List[Union[str, int]],
+        embeddings_array: npt.NDArray[np.float32],
+        payloads: List[Dict[str, Any]],
+    ) -> None:
+        """Bulk-load points with `upload_collection`.
+
+        The (N, D) array is handed to the client as is, which batches it and spreads the batches over
+        `upload_parallel` workers without building a PointStruct per vector.
+        """
+        client = self._get_client()
+        wait = self.config.durable_insert
+        try:
+            await asyncio.to_thread(
+                client.upload_collection,
+                collection_name=self._collection_name,
+                vectors=embeddings_array,
+                payload=payloads,
+                ids=qdrant_ids,
+                batch_size=max(1, self.config.upload_batch_size),
+                parallel=max(1, self.config.upload_parallel),
+                wait=wait,
+            )
+        except Exception as e:
+            logger.error(f"Error uploading vectors to Qdrant: {e}")
+            raise InvalidStorageError(f"Failed to upload vectors: {e}") from e
+
+        if not wait:
+            self._pending_write = qdrant_models.PointStruct(
+                id=qdrant_ids[-1], vector=embeddings_array[-1].tolist(), payload=payloads[-1]
+            )
+        self._size_cache += len(qdrant_ids)
+        logger.debug(f"Uploaded {len(qdrant_ids)} points to collection '{self._collection_name}'")
+
+    async def _wait_for_pending_writes(self) -> None:
+        """Wait until all unacknowledged (wait=False) upserts have been applied.
+
+        Updates are applied in order, so re-writing the last point with wait=True acts as a barrier
+        for every batch queued before it.
+        """
+        pending_write = self._pending_write
+        if pending_write is None:
+            return
+        client = self._get_client()
+        try:
+            await asyncio.to_thread(
+                client.upsert, collection_name=self._collection_name, points=[pending_write], wait=True
+            )
+        except Exception as e:
+            logger.error(f"Error flushing pending upserts to Qdrant: {e}")
+            raise InvalidStorageError(f"Failed to flush pending upserts: {e}") from e
+        # A concurrent upsert may have queued a newer write while this one was in flight
+        if self._pending_write is pending_write:
+            self._pending_write = None
+
+    def _search_batch(
+        self, embeddings_array: npt.NDArray[np.float32], top_k: int
+    ) -> List[List[qdrant_models.ScoredPoint]]:
+        """Run all queries in a single batched search request."""
+        client = self._get_client()
+        # Everything but the vector is the same for every query with a given top_k, so the (already
+        # validated) fields are built once and requests are constructed without re-running validation.
+        template = self._search_templates.get(top_k)
+        if template is None:
+            prototype = qdrant_models.SearchRequest(
+                vector=[],
+                limit=top_k,
+                params=self._search_params,
+                # Only the original ID is needed to map results back
+                with_payload=qdrant_models.PayloadSelectorInclude(include=["original_id"]),
+                with_vector=False,
+            )
+            template = {name: getattr(prototype, name) for name in prototype.model_fields_set if name != "vector"}
+            self._search_templates[top_k] = template
+        requests = [
+            qdrant_models.SearchRequest.model_construct(vector=vector, **template)
+            for vector in embeddings_array.tolist()
+        ]
+        return client.search_batch(collection_name=self._collection_name, requests=requests)
+
     async def get_knn(
         self, embeddings: Iterable[GTEmbedding], top_k: int
     ) -> Tuple[Iterable[Iterable[GTId]], npt.NDArray[TScore]]:
         """Get k-nearest neighbors for given embeddings."""
         # Validate embeddings first
-        embeddings_list = self._validate_embedding_dimensions(embeddings)
+        embeddings_array = self._normalize(self._validate_embedding_dimensions(embeddings))
         
-        if not embeddings_list:
+        if len(embeddings_array) == 0:
             return [], np.array([], dtype=TScore)
 
+        await self._wait_for_pending_writes()
+
         if self.size == 0:
-            empty_ids: List[List[GTId]] = [[] for _ in embeddings_list]
-            empty_scores = np.array([[] for _ in embeddings_list], dtype=TScore)
+            empty_ids: List[List[GTId]] = [[] for _ in embeddings_array]
+            empty_scores = np.array([[] for _ in embeddings_array], dtype=TScore)
             logger.info("Querying knn in empty collection.")
             return empty_ids, empty_scores
 
-        client = self._get_client()
         top_k = min(top_k, self.size)
         
         all_ids: List[List[GTId]] = []
         all_scores: List[List[TScore]] = []
         
         try:
-            for embedding in embeddings_list:
-                search_result = client.search(
-                    collection_name=self._collection_name,
-                    query_vector=embedding.tolist(),
-                    limit=top_k,
-                    search_params=self.config.search_params,
-                    with_payload=True,
-                    with_vectors=False,
-                )
-                
+            for search_result in self._search_batch(embeddings_array, top_k):
                 # Extract IDs and scores
                 batch_ids = []
                 batch_scores = []
@@ -381,11 +556,12 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
     ) -> csr_matrix:
         """Score all embeddings against the given queries."""
         # Validate embeddings first
-        embeddings_list = self._validate_embedding_dimensions(embeddings)
+        embeddings_array = self._normalize(self._validate_embedding_dimensions(embeddings))
+        await self._wait_for_pending_writes()
         
-        if not embeddings_list or self.size == 0:
-            logger.warning(f"No provided embeddings ({len(embeddings_list)}) or empty collection ({self.size}).")
-            return csr_matrix((len(embeddings_list), self.size))
+        if len(embeddings_array) == 0 or self.size == 0:
+            logger.warning(f"No provided embeddings ({len(embeddings_array)}) or empty collection ({self.size}).")
+            return csr_matrix((len(embeddings_array), self.size))
 
         client = self._get_client()
         top_k = min(top_k, self.size)
@@ -422,17 +598,8 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
         all_scores = []
         
         try:
-            logger.debug(f"Scoring {len(embeddings_list)} embeddings against collection '{self._collection_name}' (size: {actual_size})")
-            for query_idx, embedding in enumerate(embeddings_list):
-                search_result = client.search(
-                    collection_name=self._collection_name,
-                    query_vector=embedding.tolist(),
-                    limit=top_k,
-                    search_params=self.config.search_params,
-                    with_payload=True,
-                    with_vectors=False,
-                )
-                
+            logger.debug(f"Scoring {len(embeddings_array)} embeddings against collection '{self._collection_name}' (size: {actual_size})")
+            for query_idx, search_result in enumerate(self._search_batch(embeddings_array, top_k)):
                 for scored_point in search_result:
                     score = float(scored_point.score)
                     print(f"Scored point ID {scored_point.id} with score {score} for query index {query_idx}", threshold, str(score < threshold))
@@ -476,32 +643,42 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
         if all_scores:
             scores_matrix = csr_matrix(
                 (all_scores, (all_row_indices, all_col_indices)),
-                shape=(len(embeddings_list), actual_size),
+                shape=(len(embeddings_array), actual_size),
             )
         else:
-            scores_matrix = csr_matrix((len(embeddings_list), actual_size))
+            scores_matrix = csr_matrix((len(embeddings_array), actual_size))
 
         print(f"Scored {len(all_scores)} embeddings, resulting in matrix shape {scores_matrix.shape}")
         return scores_matrix
 
+    def _set_indexing_threshold(self, indexing_threshold: int) -> None:
+        """Update the HNSW indexing threshold of the collection."""
+        client = self._get_client()
+        client.update_collection(
+            collection_name=self._collection_name,
+            optimizer_config=qdrant_models.OptimizersConfigDiff(indexing_threshold=indexing_threshold),
+        )
+
     async def _insert_start(self):
         """Prepare the storage for inserting."""
         self._ensure_collection_exists()
+        if self.config.bulk_mode:
+            try:
+                self._set_indexing_threshold(0)
+                logger.debug(f"Disabled indexing on collection '{self._collection_name}' for bulk insertion")
+            except Exception as e:
+                logger.warning(f"Failed to disable indexing for bulk insertion: {e}")
         logger.debug(f"Qdrant collection '{self._collection_name}' ready for insertion")
 
     async def _insert_done(self):
         """Commit the storage operations after inserting."""
-        # Qdrant automatically persists data, but we can optimize the collection
+        # Qdrant automatically persists data; in bulk mode re-enable indexing so the index gets built
         if self._client:
+            await self._wait_for_pending_writes()
             try:
-                client = self._get_client()
-                # Optionally trigger optimization
-                # client.update_collection(
-                #     collection_name=self._collection_name,
-                #     optimizer_config=qdrant_models.OptimizersConfigDiff(
-                #         indexing_threshold=10000,
-                #     )
-                # )
+                if self.config.bulk_mode:
+                    self._set_indexing_threshold(self.config.indexing_threshold)
+                    logger.debug(f"Re-enabled indexing on collection '{self._collection_name}'")
                 logger.debug(f"Insert operations completed for collection '{self._collection_name}'")
             except Exception as e:
                 logger.warning(f"Error during insert completion: {e}")
@@ -604,8 +781,8 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
                 try:
                     client.delete_collection(self._collection_name)
                     logger.info(f"Deleted existing collection '{self._collection_name}'")
-                except UnexpectedResponse as e:
-                    if e.status_code != 404:  # Ignore if collection doesn't exist
+                except _QDRANT_ERRORS as e:
+                    if not _is_not_found(e):  # Ignore if collection doesn't exist
                         raise
 
                 # Update config and recreate
@@ -652,8 +829,8 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
                     "collection_vector_size": collection_info.config.params.vectors.size,
                     "collection_points_count": collection_info.points_count or 0,
                 })
-            except UnexpectedResponse as e:
-                if e.status_code == 404:
+            except _QDRANT_ERRORS as e:
+                if _is_not_found(e):
                     info["collection_exists"] = False
                 else:
                     info["collection_error"] = str(e)
@@ -701,8 +878,8 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
                     f"Config dimension mismatch: config {self.config.vector_size}, collection has {info['actual_dimension']}"
                 )
                 
-        except UnexpectedResponse as e:
-            if e.status_code == 404:
+        except _QDRANT_ERRORS as e:
+            if _is_not_found(e):
                 info["errors"].append("Collection does not exist")
             else:
                 info["errors"].append(f"Qdrant error: {e}")
@@ -733,8 +910,8 @@ class QdrantVectorStorage(BaseVectorStorage[GTId, GTEmbedding]):
                 self._ensure_collection_exists(sample_embedding=sample_embedding)
                 return True
                 
-        except UnexpectedResponse as e:
-            if e.status_code == 404:
+        except _QDRANT_ERRORS as e:
+            if _is_not_found(e):
                 # Collection doesn't exist, create it
                 self._ensure_collection_exists(sample_embedding=sample_embedding)
                 return True
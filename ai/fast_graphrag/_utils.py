@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import pickle
 import time
 from functools import wraps
 from typing import Any, Callable, List, Optional, Tuple, TypeVar, Union
@@ -64,6 +65,26 @@ def get_event_loop() -> asyncio.AbstractEventLoop:
     return loop
 
 
+async def load_pickle(path: str) -> Any:
+    """Unpickle a file in a worker thread so that the event loop is not blocked."""
+
+    def _load() -> Any:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    return await asyncio.to_thread(_load)
+
+
+async def dump_pickle(obj: Any, path: str) -> None:
+    """Pickle an object to a file in a worker thread so that the event loop is not blocked."""
+
+    def _dump() -> None:
+        with open(path, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    await asyncio.to_thread(_dump)
+
+
 def extract_sorted_scores(
     row_vector: csr_matrix,
 ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.float32]]:
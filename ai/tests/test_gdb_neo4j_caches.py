@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from fast_graphrag._storage._gdb_neo4j import Neo4jStorage, Neo4jStorageConfig  # noqa: E402
+from fast_graphrag._types import TEntity, TRelation  # noqa: E402
+
+
+class _SharedGraph:
+    """Stands in for the GraphRAGMeta version node shared by every storage on a database."""
+
+    def __init__(self):
+        self.version = 0
+
+    def attach(self, storage):
+        async def read_single(query, **params):
+            return {"version": self.version}
+
+        async def write_single(query, **params):
+            self.version += 1
+            return {"version": self.version}
+
+        storage._read_single = read_single
+        storage._write_single = write_single
+        return storage
+
+
+def _storage(graph):
+    return graph.attach(Neo4jStorage(config=Neo4jStorageConfig(node_cls=TEntity, edge_cls=TRelation)))
+
+
+def _fill_caches(storage):
+    storage._neighbours_cache[("a", "b")] = True
+    storage._relationships_attrs_cache["description"] = [["a"]]
+    storage._node_cache["a"] = (TEntity(name="a", type="person", description=""), 0)
+    storage._edge_cache[0] = TRelation(source="a", target="b", description="")
+    storage._node_count_cache = 2
+    storage._edge_count_cache = 1
+
+
+def _cached_state(storage):
+    return {
+        "neighbours": dict(storage._neighbours_cache),
+        "relationships_attrs": dict(storage._relationships_attrs_cache),
+        "nodes": dict(storage._node_cache),
+        "edges": dict(storage._edge_cache),
+        "node_count": storage._node_count_cache,
+        "edge_count": storage._edge_count_cache,
+    }
+
+
+def test_caches_survive_while_nobody_else_changes_the_graph():
+    graph = _SharedGraph()
+    storage = _storage(graph)
+
+    async def run():
+        await storage._query_start()
+        _fill_caches(storage)
+        before = _cached_state(storage)
+        # This storage's own changes are published without invalidating what it cached since
+        storage._graph_changes_unpublished = True
+        await storage._shared_graph_version()
+        await storage._query_start()
+        return before
+
+    before = asyncio.run(run())
+
+    assert _cached_state(storage) == before
+
+
+def test_caches_are_dropped_when_another_storage_changed_the_graph():
+    graph = _SharedGraph()
+    storage, other = _storage(graph), _storage(graph)
+
+    async def run():
+        await storage._query_start()
+        _fill_caches(storage)
+        other._graph_changes_unpublished = True
+        await other._insert_done()
+        await storage._query_start()
+
+    asyncio.run(run())
+
+    assert not any(_cached_state(storage).values())
@@ -0,0 +1,75 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from fast_graphrag._storage import _gdb_neo4j  # noqa: E402
+from fast_graphrag._storage._gdb_neo4j import Neo4jStorage, Neo4jStorageConfig  # noqa: E402
+from fast_graphrag._types import TEntity, TRelation  # noqa: E402
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.closed_on = None
+
+    async def close(self):
+        self.closed_on = asyncio.get_running_loop()
+
+
+@pytest.fixture
+def drivers(monkeypatch):
+    created = []
+
+    def _driver(*args, **kwargs):
+        created.append(_FakeDriver())
+        return created[-1]
+
+    monkeypatch.setattr(_gdb_neo4j, "AsyncGraphDatabase", SimpleNamespace(driver=_driver))
+    return created
+
+
+def _storage():
+    return Neo4jStorage(config=Neo4jStorageConfig(node_cls=TEntity, edge_cls=TRelation))
+
+
+def test_driver_closed_when_each_asyncio_run_finishes(drivers):
+    storage = _storage()
+
+    async def use():
+        storage._ensure_driver()
+        return asyncio.get_running_loop()
+
+    loops = [asyncio.run(use()), asyncio.run(use())]
+
+    assert len(drivers) == 2
+    assert [driver.closed_on for driver in drivers] == loops
+
+
+def test_aclose_on_another_loop_does_not_open_a_driver(drivers):
+    storage = _storage()
+
+    async def use():
+        storage._ensure_driver()
+
+    asyncio.run(use())
+    asyncio.run(storage.aclose())
+
+    assert len(drivers) == 1
+    assert drivers[0].closed_on is not None
+    assert storage._driver is None
+
+
+def test_aclose_closes_the_driver_of_the_running_loop(drivers):
+    storage = _storage()
+
+    async def use_and_close():
+        storage._ensure_driver()
+        await storage.aclose()
+        return asyncio.get_running_loop()
+
+    loop = asyncio.run(use_and_close())
+
+    assert len(drivers) == 1
+    assert drivers[0].closed_on is loop
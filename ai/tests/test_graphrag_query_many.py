@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+_graphrag = pytest.importorskip("fast_graphrag._graphrag")
+
+
+class _FakeStateManager:
+    def __init__(self, events):
+        self._events = events
+
+    async def query_start(self):
+        self._events.append("query_start")
+
+    async def query_done(self):
+        self._events.append("query_done")
+
+
+class _FakeGraphRAG:
+    """Runs one failing query next to slow ones that would keep using the storages."""
+
+    def __init__(self):
+        self.events = []
+        self.state_manager = _FakeStateManager(self.events)
+
+    async def async_query(self, query, params=None, response_model=None):
+        if query == "fail":
+            raise ValueError("query failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.events.append(f"cancelled {query}")
+            raise
+        self.events.append(f"finished {query}")
+        return query
+
+
+def test_failed_query_cancels_the_others_before_query_done():
+    rag = _FakeGraphRAG()
+
+    with pytest.raises(ValueError, match="query failed"):
+        asyncio.run(_graphrag.BaseGraphRAG.async_query_many(rag, ["a", "fail", "b"]))  # type: ignore[arg-type]
+
+    assert rag.events[0] == "query_start"
+    assert sorted(rag.events[1:-1]) == ["cancelled a", "cancelled b"]
+    assert rag.events[-1] == "query_done"
@@ -0,0 +1,84 @@
+import asyncio
+import pickle
+
+import pytest
+
+pytest.importorskip("redis")
+
+from fast_graphrag._exceptions import InvalidStorageError  # noqa: E402
+from fast_graphrag._storage._ikv_redis import RedisIndexedKeyValueStorage  # noqa: E402
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self._commands.append(name)
+
+        return command
+
+    def __len__(self):
+        return len(self._commands)
+
+    def execute(self):
+        return self._client.execute(self._commands)
+
+
+class _FakeRedis:
+    """Serves a namespace written by an older layout, with a pickled free index list to migrate."""
+
+    def __init__(self):
+        self.fail_migration = False
+        self.migrations = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def execute(self, commands):
+        assert commands == ["hgetall", "hmget"]
+        return [{b"a": b"0", b"b": b"1"}, [b"3", None, pickle.dumps([2])]]
+
+    def migrate(self, keys, args):
+        if self.fail_migration:
+            raise ConnectionError("connection lost")
+        self.migrations += 1
+        return 1
+
+
+@pytest.fixture
+def client():
+    return _FakeRedis()
+
+
+@pytest.fixture
+def storage(monkeypatch, client):
+    monkeypatch.setattr(RedisIndexedKeyValueStorage, "_initialize_redis", lambda self: None)
+    storage = RedisIndexedKeyValueStorage(config=None)
+    storage._redis_client = client
+    storage._migrate_script = client.migrate
+    return storage
+
+
+def test_failed_migration_keeps_the_loaded_map_and_retries(storage, client):
+    client.fail_migration = True
+
+    mask = asyncio.run(storage.mask_new(["a", "b", "c"]))
+
+    assert list(mask) == [False, False, True]
+    assert not storage._loaded
+
+    client.fail_migration = False
+    asyncio.run(storage.mask_new(["a"]))
+
+    assert storage._loaded
+    assert client.migrations == 1
+
+
+def test_upsert_refuses_to_allocate_before_migration(storage, client):
+    client.fail_migration = True
+
+    with pytest.raises(InvalidStorageError):
+        asyncio.run(storage.upsert(["c"], ["value"]))